@@ -57,12 +57,21 @@ class CLIChannel(BaseChannel):
         )
 
         try:
-            asyncio.run(self._chat_loop())
+            asyncio.run(self._run_chat())
         except KeyboardInterrupt:
             console.print("\n[dim]Goodbye![/]")
         finally:
             self._running = False
 
+    async def _run_chat(self) -> None:
+        """Run the chat loop, then close this loop's pooled HTTP connections."""
+        from src.utils.http_client import close_http_client
+
+        try:
+            await self._chat_loop()
+        finally:
+            await close_http_client()
+
     async def _chat_loop(self) -> None:
         """Main chat loop."""
         from src.agent.brain import AgentBrain
@@ -119,6 +119,22 @@ def create_app() -> FastAPI:
             except Exception:
                 pass
 
+        # Persist buffered cost entries
+        try:
+            from src.utils.cost_tracker import flush_cost_trackers
+
+            flush_cost_trackers()
+        except Exception:
+            pass
+
+        # Close pooled outbound HTTP connections
+        try:
+            from src.utils.http_client import close_http_client
+
+            await close_http_client()
+        except Exception:
+            pass
+
         from src.constants import DATA_DIR
 
         pid_file = DATA_DIR / "gulama.pid"
@@ -7,6 +7,8 @@ except those in AuthenticationMiddleware.PUBLIC_PATHS.
 
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
@@ -399,7 +401,8 @@ async def hub_search(request: Request, query: str = "", tag: str = "") -> dict:
     """Search the GulamaHub skill marketplace."""
     from src.skills.marketplace import GulamaHub
 
-    hub = GulamaHub()
+    # Hub construction reads the registry from disk — keep it off the event loop
+    hub = await asyncio.to_thread(GulamaHub)
     results = hub.search(query=query, tag=tag)
     return {
         "results": [
@@ -423,8 +426,8 @@ async def hub_installed(request: Request) -> dict:
     """List installed community skills."""
     from src.skills.marketplace import GulamaHub
 
-    hub = GulamaHub()
-    return {"installed": hub.list_installed()}
+    hub = await asyncio.to_thread(GulamaHub)
+    return {"installed": await asyncio.to_thread(hub.list_installed)}
 
 
 class HubUninstallRequest(BaseModel):
@@ -436,8 +439,8 @@ async def hub_uninstall(request: Request, body: HubUninstallRequest) -> dict:
     """Uninstall a community skill."""
     from src.skills.marketplace import GulamaHub
 
-    hub = GulamaHub()
-    if hub.uninstall(body.skill_name):
+    hub = await asyncio.to_thread(GulamaHub)
+    if await asyncio.to_thread(hub.uninstall, body.skill_name):
         return {"status": "uninstalled", "skill": body.skill_name}
     raise HTTPException(status_code=404, detail="Skill not found")
 
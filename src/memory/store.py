@@ -223,6 +223,35 @@ class MemoryStore:
         self.conn.commit()
         return cost_id
 
+    def record_costs(self, entries: list[dict[str, Any]]) -> int:
+        """Record many cost entries in one transaction.
+
+        Each entry carries the same fields as record_cost() plus an optional
+        ISO ``timestamp``; returns the number of rows written.
+        """
+        self.conn.executemany(
+            "INSERT INTO cost_tracking "
+            "(id, timestamp, provider, model, input_tokens, output_tokens, cost_usd, channel, skill, conversation_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    _new_id(),
+                    e.get("timestamp") or _now(),
+                    e["provider"],
+                    e["model"],
+                    e["input_tokens"],
+                    e["output_tokens"],
+                    e["cost_usd"],
+                    e.get("channel"),
+                    e.get("skill"),
+                    e.get("conversation_id"),
+                )
+                for e in entries
+            ],
+        )
+        self.conn.commit()
+        return len(entries)
+
     def get_today_cost(self) -> float:
         """Get total USD cost for today."""
         today = datetime.now(UTC).strftime("%Y-%m-%d")
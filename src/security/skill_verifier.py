@@ -98,8 +98,5 @@ class SkillVerifier:
     @staticmethod
     def _compute_hash(path: Path) -> str:
         """Compute SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
         with open(path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
@@ -14,6 +14,7 @@ Requires: pip install httpx
 
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any
 
@@ -42,6 +43,8 @@ class SmartHomeSkill(BaseSkill):
         self._ha_url: str = ""
         self._ha_token: str = ""
         self._configured = False
+        # In-flight GETs keyed by (method, path); concurrent callers share one request
+        self._inflight: dict[tuple[str, str], asyncio.Task[Any]] = {}
 
     def _load_config(self) -> None:
         """Lazy-load Home Assistant config."""
@@ -163,8 +166,36 @@ class SmartHomeSkill(BaseSkill):
             logger.error("smart_home_error", action=action, error=str(e))
             return SkillResult(success=False, output="", error=f"Smart home error: {str(e)[:300]}")
 
-    async def _ha_request(self, method: str, path: str, json_data: dict | None = None) -> dict:
-        """Make a request to the Home Assistant API."""
+    async def _ha_request(self, method: str, path: str, json_data: dict | None = None) -> Any:
+        """
+        Make a request to the Home Assistant API.
+
+        Concurrent identical GETs are coalesced: the first caller starts the
+        request as a shared task and every caller awaits it through
+        asyncio.shield, so cancelling one caller doesn't abort the request for
+        the others. Non-idempotent methods always go to the network.
+        """
+        if method != "GET":
+            return await self._ha_send(method, path, json_data)
+
+        key = (method, path)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._ha_send(method, path, json_data))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._request_done(key, t))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: tuple[str, str], task: asyncio.Task[Any]) -> None:
+        """Drop a finished shared request from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark any error retrieved, in case every caller was cancelled before it landed
+        if not task.cancelled():
+            task.exception()
+
+    async def _ha_send(self, method: str, path: str, json_data: dict | None = None) -> Any:
+        """Send a single request to the Home Assistant API."""
         import httpx
 
         url = f"{self._ha_url}/api{path}"
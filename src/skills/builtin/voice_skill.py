@@ -2,28 +2,180 @@
 Voice agent pipeline skill for Gulama.
 
 Provides speech-to-text (STT) and text-to-speech (TTS) capabilities:
-- STT: OpenAI Whisper (local or API), Deepgram, Google
+- STT: Whisper (local via faster-whisper, or OpenAI API), Deepgram
 - TTS: ElevenLabs v3 Expressive, OpenAI TTS, Google TTS
 
 Requires:
-- For Whisper STT: pip install openai-whisper (local) or openai (API)
+- For local Whisper STT: pip install faster-whisper
+- For ONNX Runtime Whisper STT: pip install "optimum[onnxruntime]" transformers
+- For whisper.cpp STT: pip install pywhispercpp
+- For OpenVINO Whisper STT (Intel CPU/GPU/NPU): pip install openvino-genai librosa
 - For ElevenLabs TTS: pip install elevenlabs
 - For Google TTS: pip install gTTS
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+import re
+import shutil
 import tempfile
+import threading
+import uuid
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from src.constants import CACHE_DIR
 from src.security.policy_engine import ActionType
 from src.skills.base import BaseSkill, SkillMetadata, SkillResult
+from src.utils.http_client import get_http_client
 from src.utils.logging import get_logger
 
+# Optional dependencies — resolved once at import, checked per call
+try:
+    import gtts
+except ImportError:
+    gtts = None
+
 logger = get_logger("voice_skill")
 
+_UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Synthesized speech is cached on disk keyed by (backend, voice, model, text)
+TTS_CACHE_DIR = CACHE_DIR / "tts"
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+TTS_CACHE_EVICT_EVERY = 32  # Run size-based eviction every N inserts
+
+# Long TTS input is split on sentence boundaries and synthesized in parallel
+TTS_MAX_CHARS = 50_000
+TTS_CHUNK_CHARS = 800
+TTS_MAX_PARALLEL = 4
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+# Voice config is read from .env / the environment once per process
+_CONFIG: dict[str, str] | None = None
+_CONFIG_LOCK = threading.Lock()
+
+
+def _get_config() -> dict[str, str]:
+    """Load .env and the voice backend settings once, shared by all instances."""
+    global _CONFIG
+    if _CONFIG is None:
+        with _CONFIG_LOCK:
+            if _CONFIG is None:
+                try:
+                    from dotenv import load_dotenv
+
+                    load_dotenv()
+                except ImportError:
+                    pass
+
+                _CONFIG = {
+                    "stt_backend": os.getenv("VOICE_STT_BACKEND", "whisper_api"),
+                    "tts_backend": os.getenv("VOICE_TTS_BACKEND", "elevenlabs"),
+                }
+    return _CONFIG
+
+
+async def _iter_file(path: str, chunk_size: int = _UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield a file in fixed-size chunks without blocking the event loop."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+
+async def _post_to_file(url: str, output_path: str, **kwargs: Any) -> tuple[int, int]:
+    """
+    POST a request and stream a 200 response body straight to output_path.
+
+    Returns (status_code, bytes_written). Nothing is written on a non-200.
+    """
+    client = get_http_client()
+    async with client.stream("POST", url, **kwargs) as response:
+        if response.status_code != 200:
+            return response.status_code, 0
+
+        total = 0
+        f = await asyncio.to_thread(open, output_path, "wb")
+        try:
+            async for chunk in response.aiter_bytes(65536):
+                await asyncio.to_thread(f.write, chunk)
+                total += len(chunk)
+        finally:
+            await asyncio.to_thread(f.close)
+        return response.status_code, total
+
+
+async def _post_many_to_file(
+    requests: list[tuple[str, dict[str, Any]]], output_path: str
+) -> tuple[int, int]:
+    """
+    Run several synthesis POSTs concurrently and concatenate the audio in order.
+
+    Each response is streamed to its own part file next to output_path, so no
+    chunk is held in memory; MP3 frames concatenate cleanly, so the parts are
+    then joined on disk as-is. Returns (status_code, bytes_written); on any
+    non-200 nothing is written.
+    """
+    if len(requests) == 1:
+        url, kwargs = requests[0]
+        return await _post_to_file(url, output_path, **kwargs)
+
+    sem = asyncio.Semaphore(TTS_MAX_PARALLEL)
+    parts = [f"{output_path}.part{i}" for i in range(len(requests))]
+
+    async def one(part: str, url: str, kwargs: dict[str, Any]) -> tuple[int, int]:
+        async with sem:
+            return await _post_to_file(url, part, **kwargs)
+
+    def _join() -> None:
+        with open(output_path, "wb") as out:
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out, _UPLOAD_CHUNK_SIZE)
+
+    def _cleanup() -> None:
+        for part in parts:
+            Path(part).unlink(missing_ok=True)
+
+    try:
+        results = await asyncio.gather(
+            *(one(part, url, kwargs) for part, (url, kwargs) in zip(parts, requests, strict=True))
+        )
+        for status_code, _ in results:
+            if status_code != 200:
+                return status_code, 0
+        await asyncio.to_thread(_join)
+        return 200, sum(size for _, size in results)
+    finally:
+        await asyncio.to_thread(_cleanup)
+
+
+def _chunk_text(text: str, limit: int = TTS_CHUNK_CHARS) -> list[str]:
+    """Group sentences into chunks of at most ~limit characters."""
+    chunks: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT_RE.split(text.strip()):
+        # A single sentence longer than the limit is hard-split
+        while len(sentence) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:limit])
+            sentence = sentence[limit:]
+        if current and len(current) + 1 + len(sentence) > limit:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 class VoiceSkill(BaseSkill):
     """
@@ -35,24 +187,37 @@ class VoiceSkill(BaseSkill):
     - list_voices: List available TTS voices
     """
 
+    # action -> handler method name, built once at class load
+    _DISPATCH: ClassVar[dict[str, str]] = {
+        "transcribe": "_transcribe",
+        "speak": "_speak",
+        "list_voices": "_list_voices",
+    }
+
     def __init__(self) -> None:
         self._stt_backend: str = "whisper_api"
         self._tts_backend: str = "elevenlabs"
         self._configured = False
+        # Local Whisper model is loaded once and reused across requests
+        self._whisper_model: Any = None
+        self._whisper_pipeline: Any = None
+        self._whisper_onnx: Any = None
+        self._whisper_cpp: Any = None
+        self._whisper_openvino: Any = None
+        self._whisper_lock = asyncio.Lock()
+        self._tts_cache_inserts = 0
+        self._tts_dir: Path | None = None
 
     def _load_config(self) -> None:
         """Lazy-load voice config from environment."""
         if self._configured:
             return
-        try:
-            from dotenv import load_dotenv
-
-            load_dotenv()
-        except ImportError:
-            pass
-
-        self._stt_backend = os.getenv("VOICE_STT_BACKEND", "whisper_api")
-        self._tts_backend = os.getenv("VOICE_TTS_BACKEND", "elevenlabs")
+        config = _get_config()
+        self._stt_backend = config["stt_backend"]
+        self._tts_backend = config["tts_backend"]
+        # Default TTS output directory is created once, not per synthesis
+        self._tts_dir = Path(tempfile.gettempdir()) / "gulama_tts"
+        self._tts_dir.mkdir(parents=True, exist_ok=True)
         self._configured = True
 
     def get_metadata(self) -> SkillMetadata:
@@ -112,19 +277,14 @@ class VoiceSkill(BaseSkill):
         """Execute a voice action."""
         action = kwargs.get("action", "transcribe")
 
-        dispatch = {
-            "transcribe": self._transcribe,
-            "speak": self._speak,
-            "list_voices": self._list_voices,
-        }
-
-        handler = dispatch.get(action)
-        if not handler:
+        handler_name = self._DISPATCH.get(action)
+        if not handler_name:
             return SkillResult(
                 success=False,
                 output="",
                 error=f"Unknown voice action: {action}. Use: transcribe, speak, list_voices",
             )
+        handler = getattr(self, handler_name)
 
         self._load_config()
 
@@ -157,6 +317,12 @@ class VoiceSkill(BaseSkill):
 
         if self._stt_backend == "whisper_local":
             return await self._transcribe_whisper_local(audio_path, language)
+        elif self._stt_backend == "whisper_onnx":
+            return await self._transcribe_whisper_onnx(audio_path, language)
+        elif self._stt_backend == "whisper_cpp":
+            return await self._transcribe_whisper_cpp(audio_path, language)
+        elif self._stt_backend == "openvino":
+            return await self._transcribe_openvino(audio_path, language)
         elif self._stt_backend == "whisper_api":
             return await self._transcribe_whisper_api(audio_path, language)
         elif self._stt_backend == "deepgram":
@@ -168,13 +334,44 @@ class VoiceSkill(BaseSkill):
                 error=f"Unknown STT backend: {self._stt_backend}",
             )
 
+    async def _get_whisper_pipeline(self) -> Any:
+        """Load the local faster-whisper model and batched pipeline on first use."""
+        if self._whisper_pipeline is None:
+            async with self._whisper_lock:
+                if self._whisper_pipeline is None:
+                    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+                    model_name = os.getenv("WHISPER_MODEL", "base")
+                    self._whisper_model = await asyncio.to_thread(
+                        WhisperModel,
+                        model_name,
+                        device=os.getenv("WHISPER_DEVICE", "cpu"),
+                        compute_type=os.getenv("WHISPER_COMPUTE", "int8"),
+                        # 0 keeps CTranslate2's default; raise it on many-core CPU hosts
+                        cpu_threads=int(os.getenv("WHISPER_CPU_THREADS", "0")),
+                    )
+                    self._whisper_pipeline = BatchedInferencePipeline(model=self._whisper_model)
+                    logger.info("whisper_model_loaded", model=model_name)
+        return self._whisper_pipeline
+
     async def _transcribe_whisper_local(self, audio_path: str, language: str) -> SkillResult:
-        """Transcribe using local Whisper model."""
-        import whisper
+        """Transcribe using a local faster-whisper (CTranslate2) model."""
+        pipeline = await self._get_whisper_pipeline()
+        batch_size = int(os.getenv("VOICE_BATCH", "8"))
+
+        def _run() -> str:
+            # VAD splits the audio into chunks that are decoded batch_size at a time.
+            # Segments are a lazy generator — decoding happens while iterating.
+            segments, _info = pipeline.transcribe(
+                audio_path,
+                language=language,
+                batch_size=batch_size,
+                beam_size=1,
+                vad_filter=True,
+            )
+            return "".join(segment.text for segment in segments).strip()
 
-        model = whisper.load_model("base")
-        result = model.transcribe(audio_path, language=language)
-        text = result.get("text", "").strip()
+        text = await asyncio.to_thread(_run)
 
         return SkillResult(
             success=True,
@@ -182,6 +379,115 @@ class VoiceSkill(BaseSkill):
             metadata={"backend": "whisper_local", "language": language},
         )
 
+    @staticmethod
+    def _load_whisper_onnx() -> Any:
+        """
+        Build an ONNX Runtime Whisper pipeline.
+
+        WHISPER_ONNX_MODEL must point at a model exported with
+        `optimum-cli export onnx --model openai/whisper-base <dir>`; the export
+        uses fused multi-head attention. On CUDA, decoder tensors stay on the
+        device via IOBinding.
+        """
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import AutoProcessor, pipeline
+
+        model_dir = os.getenv("WHISPER_ONNX_MODEL", str(CACHE_DIR / "whisper-onnx"))
+        provider = os.getenv("WHISPER_ONNX_PROVIDER", "CPUExecutionProvider")
+
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            model_dir,
+            provider=provider,
+            use_io_binding=provider == "CUDAExecutionProvider",
+        )
+        processor = AutoProcessor.from_pretrained(model_dir)
+        logger.info("whisper_onnx_loaded", model=model_dir, provider=provider)
+        return pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30,
+        )
+
+    async def _transcribe_whisper_onnx(self, audio_path: str, language: str) -> SkillResult:
+        """Transcribe using an ONNX Runtime Whisper model."""
+        if self._whisper_onnx is None:
+            async with self._whisper_lock:
+                if self._whisper_onnx is None:
+                    self._whisper_onnx = await asyncio.to_thread(self._load_whisper_onnx)
+
+        result = await asyncio.to_thread(
+            self._whisper_onnx,
+            audio_path,
+            generate_kwargs={"language": language, "task": "transcribe"},
+        )
+        text = result.get("text", "").strip()
+
+        return SkillResult(
+            success=True,
+            output=text,
+            metadata={"backend": "whisper_onnx", "language": language},
+        )
+
+    async def _transcribe_whisper_cpp(self, audio_path: str, language: str) -> SkillResult:
+        """Transcribe using whisper.cpp (ggml, quantized CPU inference)."""
+        if self._whisper_cpp is None:
+            async with self._whisper_lock:
+                if self._whisper_cpp is None:
+                    from pywhispercpp.model import Model
+
+                    model_name = os.getenv("WHISPER_CPP_MODEL", "base-q5_1")
+                    self._whisper_cpp = await asyncio.to_thread(
+                        Model, model_name, n_threads=os.cpu_count() or 4
+                    )
+                    logger.info("whisper_cpp_loaded", model=model_name)
+
+        segments = await asyncio.to_thread(
+            self._whisper_cpp.transcribe, audio_path, language=language
+        )
+        text = "".join(segment.text for segment in segments).strip()
+
+        return SkillResult(
+            success=True,
+            output=text,
+            metadata={"backend": "whisper_cpp", "language": language},
+        )
+
+    async def _transcribe_openvino(self, audio_path: str, language: str) -> SkillResult:
+        """Transcribe using an OpenVINO GenAI Whisper pipeline."""
+        if self._whisper_openvino is None:
+            async with self._whisper_lock:
+                if self._whisper_openvino is None:
+                    import openvino_genai as ov_genai
+
+                    model_dir = os.getenv("WHISPER_OV_MODEL", str(CACHE_DIR / "whisper-openvino"))
+                    device = os.getenv("WHISPER_OV_DEVICE", "CPU")
+                    # Compiled kernels are cached on disk so later launches skip compilation
+                    ov_cache = CACHE_DIR / "openvino"
+                    ov_cache.mkdir(parents=True, exist_ok=True)
+                    self._whisper_openvino = await asyncio.to_thread(
+                        ov_genai.WhisperPipeline, model_dir, device, CACHE_DIR=str(ov_cache)
+                    )
+                    logger.info("whisper_openvino_loaded", model=model_dir, device=device)
+
+        import librosa
+
+        def _run() -> str:
+            raw_speech, _sr = librosa.load(audio_path, sr=16000)
+            result = self._whisper_openvino.generate(
+                raw_speech.tolist(), language=f"<|{language}|>", task="transcribe"
+            )
+            return result.texts[0]
+
+        text = (await asyncio.to_thread(_run)).strip()
+
+        return SkillResult(
+            success=True,
+            output=text,
+            metadata={"backend": "openvino", "language": language},
+        )
+
     async def _transcribe_whisper_api(self, audio_path: str, language: str) -> SkillResult:
         """Transcribe using OpenAI Whisper API."""
         api_key = os.getenv("OPENAI_API_KEY", "")
@@ -198,31 +504,30 @@ class VoiceSkill(BaseSkill):
                 ),
             )
 
-        import httpx
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            with open(audio_path, "rb") as f:
-                response = await client.post(
-                    "https://api.openai.com/v1/audio/transcriptions",
-                    headers={"Authorization": f"Bearer {api_key}"},
-                    data={"model": "whisper-1", "language": language},
-                    files={"file": (Path(audio_path).name, f, "audio/mpeg")},
-                )
-
-            if response.status_code != 200:
-                return SkillResult(
-                    success=False,
-                    output="",
-                    error=f"Whisper API error: {response.status_code}",
-                )
+        client = get_http_client()
+        with open(audio_path, "rb") as f:
+            response = await client.post(
+                "https://api.openai.com/v1/audio/transcriptions",
+                headers={"Authorization": f"Bearer {api_key}"},
+                data={"model": "whisper-1", "language": language},
+                files={"file": (Path(audio_path).name, f, "audio/mpeg")},
+                timeout=60.0,
+            )
 
-            text = response.json().get("text", "").strip()
+        if response.status_code != 200:
             return SkillResult(
-                success=True,
-                output=text,
-                metadata={"backend": "whisper_api", "language": language},
+                success=False,
+                output="",
+                error=f"Whisper API error: {response.status_code}",
             )
 
+        text = response.json().get("text", "").strip()
+        return SkillResult(
+            success=True,
+            output=text,
+            metadata={"backend": "whisper_api", "language": language},
+        )
+
     async def _transcribe_deepgram(self, audio_path: str, language: str) -> SkillResult:
         """Transcribe using Deepgram API."""
         api_key = os.getenv("DEEPGRAM_API_KEY", "")
@@ -237,40 +542,40 @@ class VoiceSkill(BaseSkill):
                 ),
             )
 
-        import httpx
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            with open(audio_path, "rb") as f:
-                response = await client.post(
-                    "https://api.deepgram.com/v1/listen",
-                    headers={
-                        "Authorization": f"Token {api_key}",
-                        "Content-Type": "audio/mpeg",
-                    },
-                    params={"model": "nova-2", "language": language},
-                    content=f.read(),
-                )
-
-            if response.status_code != 200:
-                return SkillResult(
-                    success=False,
-                    output="",
-                    error=f"Deepgram API error: {response.status_code}",
-                )
+        client = get_http_client()
+        # Stream the audio from disk instead of buffering the whole file
+        response = await client.post(
+            "https://api.deepgram.com/v1/listen",
+            headers={
+                "Authorization": f"Token {api_key}",
+                "Content-Type": "audio/mpeg",
+                "Content-Length": str(os.path.getsize(audio_path)),
+            },
+            params={"model": "nova-2", "language": language},
+            content=_iter_file(audio_path),
+            timeout=60.0,
+        )
 
-            data = response.json()
-            text = (
-                data.get("results", {})
-                .get("channels", [{}])[0]
-                .get("alternatives", [{}])[0]
-                .get("transcript", "")
-            )
+        if response.status_code != 200:
             return SkillResult(
-                success=True,
-                output=text,
-                metadata={"backend": "deepgram", "language": language},
+                success=False,
+                output="",
+                error=f"Deepgram API error: {response.status_code}",
             )
 
+        data = response.json()
+        text = (
+            data.get("results", {})
+            .get("channels", [{}])[0]
+            .get("alternatives", [{}])[0]
+            .get("transcript", "")
+        )
+        return SkillResult(
+            success=True,
+            output=text,
+            metadata={"backend": "deepgram", "language": language},
+        )
+
     async def _speak(
         self,
         text: str = "",
@@ -280,11 +585,14 @@ class VoiceSkill(BaseSkill):
         **_: Any,
     ) -> SkillResult:
         """Convert text to speech."""
-        if not text:
+        if not text or not text.strip():
             return SkillResult(success=False, output="", error="text is required for speak action")
 
         if not output_path:
-            output_path = os.path.join(tempfile.gettempdir(), "gulama_tts_output.mp3")
+            output_path = str(self._tts_dir / f"tts_{uuid.uuid4().hex}.mp3")
+        else:
+            # Caller-chosen paths are created once here, before any backend
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         if self._tts_backend == "elevenlabs":
             return await self._speak_elevenlabs(text, output_path, voice_id)
@@ -306,42 +614,62 @@ class VoiceSkill(BaseSkill):
             return SkillResult(success=False, output="", error="ELEVENLABS_API_KEY not set")
 
         voice = voice_id or "21m00Tcm4TlvDq8ikWAM"  # Default: Rachel
+        model = "eleven_multilingual_v2"
+        text = text[:TTS_MAX_CHARS]
 
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"https://api.elevenlabs.io/v1/text-to-speech/{voice}",
-                headers={
-                    "xi-api-key": api_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "text": text[:5000],
-                    "model_id": "eleven_multilingual_v2",
-                    "voice_settings": {
-                        "stability": 0.5,
-                        "similarity_boost": 0.75,
-                    },
+        cache_key = self._tts_cache_key("elevenlabs", voice, model, text)
+        if await asyncio.to_thread(self._tts_cache_fetch, cache_key, output_path):
+            return SkillResult(
+                success=True,
+                output=f"Audio saved to {output_path} (cached)",
+                metadata={
+                    "backend": "elevenlabs",
+                    "voice": voice,
+                    "path": output_path,
+                    "cached": True,
                 },
             )
 
-            if response.status_code != 200:
-                return SkillResult(
-                    success=False,
-                    output="",
-                    error=f"ElevenLabs API error: {response.status_code}",
+        status_code, size = await _post_many_to_file(
+            [
+                (
+                    f"https://api.elevenlabs.io/v1/text-to-speech/{voice}",
+                    {
+                        "headers": {
+                            "xi-api-key": api_key,
+                            "Content-Type": "application/json",
+                        },
+                        "json": {
+                            "text": chunk,
+                            "model_id": model,
+                            "voice_settings": {
+                                "stability": 0.5,
+                                "similarity_boost": 0.75,
+                            },
+                        },
+                        "timeout": 30.0,
+                    },
                 )
+                for chunk in _chunk_text(text)
+            ],
+            output_path,
+        )
 
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            Path(output_path).write_bytes(response.content)
-
+        if status_code != 200:
             return SkillResult(
-                success=True,
-                output=f"Audio saved to {output_path} ({len(response.content)} bytes)",
-                metadata={"backend": "elevenlabs", "voice": voice, "path": output_path},
+                success=False,
+                output="",
+                error=f"ElevenLabs API error: {status_code}",
             )
 
+        await asyncio.to_thread(self._tts_cache_store, cache_key, output_path)
+
+        return SkillResult(
+            success=True,
+            output=f"Audio saved to {output_path} ({size} bytes)",
+            metadata={"backend": "elevenlabs", "voice": voice, "path": output_path},
+        )
+
     async def _speak_openai(self, text: str, output_path: str, voice_id: str) -> SkillResult:
         """Text-to-speech using OpenAI."""
         api_key = os.getenv("OPENAI_API_KEY", "")
@@ -359,46 +687,82 @@ class VoiceSkill(BaseSkill):
             )
 
         voice = voice_id or "alloy"
+        model = "tts-1"
+        text = text[:TTS_MAX_CHARS]
 
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.openai.com/v1/audio/speech",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": "tts-1",
-                    "input": text[:4096],
-                    "voice": voice,
-                },
+        cache_key = self._tts_cache_key("openai", voice, model, text)
+        if await asyncio.to_thread(self._tts_cache_fetch, cache_key, output_path):
+            return SkillResult(
+                success=True,
+                output=f"Audio saved to {output_path} (cached)",
+                metadata={"backend": "openai", "voice": voice, "path": output_path, "cached": True},
             )
 
-            if response.status_code != 200:
-                return SkillResult(
-                    success=False,
-                    output="",
-                    error=f"OpenAI TTS error: {response.status_code}",
+        status_code, size = await _post_many_to_file(
+            [
+                (
+                    "https://api.openai.com/v1/audio/speech",
+                    {
+                        "headers": {
+                            "Authorization": f"Bearer {api_key}",
+                            "Content-Type": "application/json",
+                        },
+                        "json": {
+                            "model": model,
+                            "input": chunk,
+                            "voice": voice,
+                        },
+                        "timeout": 30.0,
+                    },
                 )
+                for chunk in _chunk_text(text)
+            ],
+            output_path,
+        )
 
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            Path(output_path).write_bytes(response.content)
-
+        if status_code != 200:
             return SkillResult(
-                success=True,
-                output=f"Audio saved to {output_path}",
-                metadata={"backend": "openai", "voice": voice, "path": output_path},
+                success=False,
+                output="",
+                error=f"OpenAI TTS error: {status_code}",
             )
 
+        await asyncio.to_thread(self._tts_cache_store, cache_key, output_path)
+
+        return SkillResult(
+            success=True,
+            output=f"Audio saved to {output_path} ({size} bytes)",
+            metadata={"backend": "openai", "voice": voice, "path": output_path},
+        )
+
     async def _speak_gtts(self, text: str, output_path: str, language: str) -> SkillResult:
         """Text-to-speech using Google TTS (gTTS, free)."""
-        from gtts import gTTS
+        # gTTS already splits long input into short requests internally
+        text = text[:TTS_MAX_CHARS]
 
-        tts = gTTS(text=text[:5000], lang=language)
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        cache_key = self._tts_cache_key("gtts", language, "", text)
+        if await asyncio.to_thread(self._tts_cache_fetch, cache_key, output_path):
+            return SkillResult(
+                success=True,
+                output=f"Audio saved to {output_path} (cached)",
+                metadata={
+                    "backend": "gtts",
+                    "language": language,
+                    "path": output_path,
+                    "cached": True,
+                },
+            )
+
+        if gtts is None:
+            return SkillResult(
+                success=False,
+                output="",
+                error="Missing dependency: gTTS. Install: pip install gTTS",
+            )
+
+        tts = gtts.gTTS(text=text, lang=language)
         tts.save(output_path)
+        await asyncio.to_thread(self._tts_cache_store, cache_key, output_path)
 
         return SkillResult(
             success=True,
@@ -406,6 +770,72 @@ class VoiceSkill(BaseSkill):
             metadata={"backend": "gtts", "language": language, "path": output_path},
         )
 
+    # ── TTS cache ─────────────────────────────────────
+
+    @staticmethod
+    def _tts_cache_key(backend: str, voice: str, model: str, text: str) -> str:
+        """Cache key for a synthesis request."""
+        return hashlib.blake2b(
+            f"{backend}|{voice}|{model}|{text}".encode(), digest_size=20
+        ).hexdigest()
+
+    @staticmethod
+    def _tts_cache_fetch(key: str, output_path: str) -> bool:
+        """Copy cached audio to output_path (blocking; run it in a thread).
+
+        Returns False on a miss, including any I/O error reading or copying the entry.
+        """
+        cached = TTS_CACHE_DIR / f"{key}.mp3"
+        try:
+            shutil.copyfile(cached, output_path)
+            os.utime(cached)  # Refresh mtime so eviction is least-recently-used
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning("tts_cache_fetch_failed", error=str(e))
+            return False
+        logger.debug("tts_cache_hit", key=key)
+        return True
+
+    def _tts_cache_store(self, key: str, output_path: str) -> None:
+        """Store synthesized audio in the cache (blocking). Failures are non-fatal."""
+        try:
+            TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, TTS_CACHE_DIR / f"{key}.mp3")
+        except OSError as e:
+            logger.warning("tts_cache_store_failed", error=str(e))
+            return
+
+        self._tts_cache_inserts += 1
+        if self._tts_cache_inserts % TTS_CACHE_EVICT_EVERY == 0:
+            self._tts_cache_evict()
+
+    @staticmethod
+    def _tts_cache_evict(max_bytes: int = TTS_CACHE_MAX_BYTES) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(TTS_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+
+        if total <= max_bytes:
+            return
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes:
+                break
+        logger.info("tts_cache_evicted", remaining_bytes=total)
+
     async def _list_voices(self, **_: Any) -> SkillResult:
         """List available TTS voices."""
         voices = {
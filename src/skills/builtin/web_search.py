@@ -11,18 +11,112 @@ All network requests go through the egress filter.
 
 from __future__ import annotations
 
-from typing import Any
-
+import asyncio
+import functools
+import importlib.util
+import re
+import time
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Any, ClassVar
+
+from src.security.egress_filter import EgressFilter
+from src.security.input_validator import InputValidator
 from src.security.policy_engine import ActionType
 from src.skills.base import BaseSkill, SkillMetadata, SkillResult
+from src.utils.http_client import get_http_client
 from src.utils.logging import get_logger
 
+# Optional dependencies — resolved once at import, checked per call
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    from ddgs import DDGS
+except ImportError:
+    try:
+        from duckduckgo_search import DDGS
+    except ImportError:
+        DDGS = None
+
 logger = get_logger("web_search")
 
+# Elements whose text is never useful page content
+_SKIP_TAGS = ("script", "style", "nav", "footer", "header")
+_BLOCK_TAGS = ("p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "li")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# HTML beyond this many bytes is not downloaded or parsed
+MAX_HTML_BYTES = 256 * 1024
+# Fetched page text returned to the model is capped at this many characters
+MAX_OUTPUT_CHARS = 10_000
+
+# Only advertise encodings httpx can decode (br/zstd need httpx[brotli,zstd])
+_ENCODINGS = ["gzip"]
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    _ENCODINGS.append("br")
+if importlib.util.find_spec("zstandard"):
+    _ENCODINGS.append("zstd")
+
+_FETCH_HEADERS = {
+    "User-Agent": "Gulama/0.2 (+https://gulama.ai)",
+    "Accept": "text/html,application/xhtml+xml,text/plain;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": ", ".join(_ENCODINGS),
+}
+
+# Search results are reused for identical queries within the TTL
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL_SECONDS = 300
+
+# search_and_read: concurrent page fetches and per-page output budget
+MAX_CONCURRENT_FETCHES = 8
+READ_CHARS_PER_PAGE = 3000
+
+
+class _TextExtractor(HTMLParser):
+    """Pure-Python fallback used when selectolax is not installed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.text_parts: list[str] = []
+        self._skip = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip = False
+        if tag in _BLOCK_TAGS:
+            self.text_parts.append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip:
+            self.text_parts.append(data.strip())
+
 
 class WebSearchSkill(BaseSkill):
     """Web search and page fetching."""
 
+    # operation -> (handler method name, required argument, label for errors)
+    _DISPATCH: ClassVar[dict[str, tuple[str, str, str]]] = {
+        "search": ("_search", "query", "Query"),
+        "search_and_read": ("_search_and_read", "query", "Query"),
+        "fetch": ("_fetch", "url", "URL"),
+    }
+
+    def __init__(self) -> None:
+        # Long-lived DDGS session, created on first search
+        self._ddgs: Any = None
+        # (query, max_results) -> (expires_at, results)
+        self._search_cache: OrderedDict[tuple[str, int], tuple[float, list[dict[str, str]]]] = (
+            OrderedDict()
+        )
+
     def get_metadata(self) -> SkillMetadata:
         return SkillMetadata(
             name="web_search",
@@ -36,49 +130,82 @@ class WebSearchSkill(BaseSkill):
     async def execute(self, **kwargs: Any) -> SkillResult:
         """Execute a web operation."""
         operation = kwargs.get("operation", "search")
-        query = kwargs.get("query", "")
-        url = kwargs.get("url", "")
-
-        match operation:
-            case "search":
-                if not query:
-                    return SkillResult(
-                        success=False, output="", error="Query is required for search"
-                    )
-                return await self._search(query)
-            case "fetch":
-                if not url:
-                    return SkillResult(success=False, output="", error="URL is required for fetch")
-                return await self._fetch(url)
-            case _:
-                return SkillResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown operation: {operation}",
-                )
+
+        entry = self._DISPATCH.get(operation)
+        if entry is None:
+            return SkillResult(
+                success=False,
+                output="",
+                error=f"Unknown operation: {operation}",
+            )
+
+        handler_name, arg_name, label = entry
+        arg = kwargs.get(arg_name, "")
+        if not arg:
+            return SkillResult(
+                success=False, output="", error=f"{label} is required for {operation}"
+            )
+        return await getattr(self, handler_name)(arg)
 
     async def _search(self, query: str, max_results: int = 5) -> SkillResult:
         """Search the web using DuckDuckGo."""
         try:
-            try:
-                from ddgs import DDGS
-            except ImportError:
-                from duckduckgo_search import DDGS
-
-            results = []
-            with DDGS() as ddgs:
-                for r in ddgs.text(query, max_results=max_results):
-                    results.append(f"**{r['title']}**\n{r['href']}\n{r['body']}\n")
-
-            if not results:
-                return SkillResult(success=True, output="No results found.")
-
+            results, cached = await self._search_results(query, max_results)
+        except ImportError:
             return SkillResult(
-                success=True,
-                output="\n---\n".join(results),
-                metadata={"result_count": len(results)},
+                success=False,
+                output="",
+                error="duckduckgo_search package not installed. Run: pip install duckduckgo-search",
             )
+        except Exception as e:
+            return SkillResult(success=False, output="", error=str(e))
+
+        if not results:
+            return SkillResult(success=True, output="No results found.")
 
+        metadata: dict[str, Any] = {"result_count": len(results)}
+        if cached:
+            metadata["cached"] = True
+        return SkillResult(
+            success=True,
+            output="\n---\n".join(f"**{r['title']}**\n{r['href']}\n{r['body']}\n" for r in results),
+            metadata=metadata,
+        )
+
+    async def _search_results(
+        self, query: str, max_results: int
+    ) -> tuple[list[dict[str, str]], bool]:
+        """Return raw DuckDuckGo results and whether they came from the cache."""
+        key = (query, max_results)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            expires_at, results = cached
+            if time.monotonic() < expires_at:
+                self._search_cache.move_to_end(key)
+                return results, True
+            del self._search_cache[key]
+
+        if self._ddgs is None:
+            if DDGS is None:
+                raise ImportError("duckduckgo_search")
+            self._ddgs = DDGS()
+
+        results = [
+            {"title": r["title"], "href": r["href"], "body": r["body"]}
+            for r in self._ddgs.text(query, max_results=max_results)
+        ]
+
+        if results:
+            self._search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, results)
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+        return results, False
+
+    async def _search_and_read(self, query: str, max_results: int = 5) -> SkillResult:
+        """Search, then fetch every result page concurrently."""
+        try:
+            results, _cached = await self._search_results(query, max_results)
         except ImportError:
             return SkillResult(
                 success=False,
@@ -88,11 +215,41 @@ class WebSearchSkill(BaseSkill):
         except Exception as e:
             return SkillResult(success=False, output="", error=str(e))
 
+        if not results:
+            return SkillResult(success=True, output="No results found.")
+
+        pages = await self._fetch_many([r["href"] for r in results])
+
+        sections = []
+        read_count = 0
+        for r, page in zip(results, pages, strict=True):
+            if isinstance(page, SkillResult) and page.success:
+                read_count += 1
+                body = page.output[:READ_CHARS_PER_PAGE]
+            else:
+                # Fall back to the search snippet when the page can't be read
+                body = r["body"]
+            sections.append(f"**{r['title']}**\n{r['href']}\n{body}\n")
+
+        return SkillResult(
+            success=True,
+            output="\n---\n".join(sections),
+            metadata={"result_count": len(results), "pages_read": read_count},
+        )
+
+    async def _fetch_many(self, urls: list[str]) -> list[SkillResult | BaseException]:
+        """Fetch several URLs concurrently, at most MAX_CONCURRENT_FETCHES at a time."""
+        sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def one(url: str) -> SkillResult:
+            async with sem:
+                return await self._fetch(url)
+
+        return await asyncio.gather(*(one(u) for u in urls), return_exceptions=True)
+
     async def _fetch(self, url: str) -> SkillResult:
         """Fetch and extract text from a URL."""
         # Validate URL
-        from src.security.input_validator import InputValidator
-
         validator = InputValidator()
         result = validator.validate_url(url)
         if not result.valid:
@@ -103,8 +260,6 @@ class WebSearchSkill(BaseSkill):
             )
 
         # Check egress filter
-        from src.security.egress_filter import EgressFilter
-
         egress = EgressFilter()
         decision = egress.check_request(url=url, method="GET")
         if not decision.allowed:
@@ -115,90 +270,112 @@ class WebSearchSkill(BaseSkill):
             )
 
         try:
-            import httpx
-
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                resp = await client.get(url, headers={"User-Agent": "Gulama/0.2 (+https://gulama.ai)"})
+            client = get_http_client()
+            async with client.stream(
+                "GET",
+                url,
+                headers=_FETCH_HEADERS,
+                follow_redirects=True,
+                timeout=30.0,
+            ) as resp:
                 resp.raise_for_status()
+                status_code = resp.status_code
 
                 content_type = resp.headers.get("content-type", "")
                 if "text/html" in content_type:
-                    # Extract text from HTML
-                    text = self._extract_text(resp.text)
+                    # Extract text from HTML — the first MAX_HTML_BYTES hold the readable content
+                    html = await self._read_capped(resp, MAX_HTML_BYTES)
+                    text = self._extract_text(html)
                 else:
-                    text = resp.text
+                    text = await self._read_text_capped(resp, MAX_OUTPUT_CHARS)
 
-                # Limit output size
-                if len(text) > 10000:
-                    text = text[:10000] + "\n\n[Truncated — content too long]"
+            # Limit output size
+            if len(text) > MAX_OUTPUT_CHARS:
+                text = text[:MAX_OUTPUT_CHARS] + "\n\n[Truncated — content too long]"
 
-                return SkillResult(
-                    success=True,
-                    output=text,
-                    metadata={"url": url, "status_code": resp.status_code},
-                )
-
-        except ImportError:
             return SkillResult(
-                success=False,
-                output="",
-                error="httpx package not installed. Run: pip install httpx",
+                success=True,
+                output=text,
+                metadata={"url": url, "status_code": status_code},
             )
+
         except Exception as e:
             return SkillResult(success=False, output="", error=str(e))
 
     @staticmethod
-    def _extract_text(html: str) -> str:
-        """Extract readable text from HTML."""
+    async def _read_capped(resp: Any, limit: int) -> str:
+        """Read at most ~limit bytes of a streamed response and decode them."""
+        chunks: list[bytes] = []
+        total = 0
+        async for chunk in resp.aiter_bytes(65536):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= limit:
+                break
+
+        data = b"".join(chunks)
         try:
-            from html.parser import HTMLParser
-
-            class TextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text_parts = []
-                    self._skip = False
+            return data.decode(resp.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return data.decode("utf-8", errors="replace")
 
-                def handle_starttag(self, tag, attrs):
-                    if tag in ("script", "style", "nav", "footer", "header"):
-                        self._skip = True
-
-                def handle_endtag(self, tag):
-                    if tag in ("script", "style", "nav", "footer", "header"):
-                        self._skip = False
-                    if tag in ("p", "div", "br", "h1", "h2", "h3", "h4", "h5", "h6", "li"):
-                        self.text_parts.append("\n")
+    @staticmethod
+    async def _read_text_capped(resp: Any, limit: int) -> str:
+        """Decode a streamed response only until more than limit characters are read."""
+        parts: list[str] = []
+        total = 0
+        async for part in resp.aiter_text(16384):
+            parts.append(part)
+            total += len(part)
+            if total > limit:
+                break
+        # Keep one extra character so the caller can tell the text was truncated
+        return "".join(parts)[: limit + 1]
 
-                def handle_data(self, data):
-                    if not self._skip:
-                        self.text_parts.append(data.strip())
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _extract_text(html: str) -> str:
+        """Extract readable text from HTML."""
+        if LexborHTMLParser is not None:
+            try:
+                tree = LexborHTMLParser(html)
+                tree.strip_tags(list(_SKIP_TAGS))
+                root = tree.body or tree.root
+                return root.text(separator=" ", strip=True) if root else ""
+            except Exception:
+                pass
 
-            extractor = TextExtractor()
+        try:
+            extractor = _TextExtractor()
             extractor.feed(html)
             return " ".join(extractor.text_parts).strip()
         except Exception:
             # Fallback: strip all tags
-            import re
-
-            return re.sub(r"<[^>]+>", " ", html).strip()
+            return _TAG_RE.sub(" ", html).strip()
 
     def get_tool_definition(self) -> dict[str, Any]:
         return {
             "type": "function",
             "function": {
                 "name": "web_search",
-                "description": "Search the web or fetch a web page. Operations: search, fetch",
+                "description": (
+                    "Search the web or fetch a web page. "
+                    "Operations: search, fetch, search_and_read (search + read each result page)"
+                ),
                 "parameters": {
                     "type": "object",
                     "properties": {
                         "operation": {
                             "type": "string",
-                            "enum": ["search", "fetch"],
-                            "description": "search = web search, fetch = get page content",
+                            "enum": ["search", "fetch", "search_and_read"],
+                            "description": (
+                                "search = web search, fetch = get page content, "
+                                "search_and_read = search and fetch result pages"
+                            ),
                         },
                         "query": {
                             "type": "string",
-                            "description": "Search query (for search operation)",
+                            "description": "Search query (for search operations)",
                         },
                         "url": {
                             "type": "string",
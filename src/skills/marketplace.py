@@ -21,18 +21,47 @@ Security model:
 
 from __future__ import annotations
 
+import functools
 import hashlib
-import json
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 
+import orjson
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+
 from src.constants import DATA_DIR, SKILLS_DIR
 from src.utils.logging import get_logger
 
 logger = get_logger("marketplace")
 
+# Parsed registries shared by all GulamaHub instances, keyed by file path and
+# revalidated against the file's mtime and size so a publish is seen immediately.
+_REGISTRY_CACHE: dict[Path, tuple[tuple[int, int], dict[str, SkillPackage]]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+# Bulk installs verify signatures concurrently on this many threads
+VERIFY_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=1024)
+def _load_public_key(public_key_hex: str) -> Ed25519PublicKey:
+    """Parse an author's public key once; the same few keys sign most packages."""
+    return Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+
+
+@functools.lru_cache(maxsize=256)
+def _load_manifest(path: str, mtime_ns: int) -> dict:
+    """Parse an installed skill's manifest; mtime_ns in the key invalidates edits."""
+    return orjson.loads(Path(path).read_bytes())
+
 
 @dataclass
 class SkillPackage:
@@ -52,6 +81,16 @@ class SkillPackage:
     dependencies: list[str] = field(default_factory=list)
     tags: list[str] = field(default_factory=list)
 
+    # Lowercased search keys, computed once when the package is loaded
+    _name_lc: str = field(default="", init=False, repr=False, compare=False)
+    _desc_lc: str = field(default="", init=False, repr=False, compare=False)
+    _tags_lc: frozenset[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._name_lc = self.name.lower()
+        self._desc_lc = self.description.lower()
+        self._tags_lc = frozenset(t.lower() for t in self.tags)
+
 
 class GulamaHub:
     """
@@ -69,17 +108,38 @@ class GulamaHub:
     def __init__(self) -> None:
         self.INSTALLED_DIR.mkdir(parents=True, exist_ok=True)
         self.KEYS_DIR.mkdir(parents=True, exist_ok=True)
-        self._registry: list[SkillPackage] = []
+        # Packages indexed by name for O(1) lookup and replacement on publish
+        self._registry: dict[str, SkillPackage] = {}
         self._load_registry()
 
     def _load_registry(self) -> None:
-        """Load the local skill registry."""
-        if self.REGISTRY_FILE.exists():
-            try:
-                data = json.loads(self.REGISTRY_FILE.read_text(encoding="utf-8"))
-                self._registry = [SkillPackage(**pkg) for pkg in data]
-            except Exception as e:
-                logger.warning("registry_load_failed", error=str(e))
+        """Load the local skill registry (parsed once per file revision)."""
+        try:
+            stamp = self._registry_stamp()
+        except FileNotFoundError:
+            return
+
+        with _REGISTRY_LOCK:
+            cached = _REGISTRY_CACHE.get(self.REGISTRY_FILE)
+        if cached is not None and cached[0] == stamp:
+            self._registry = dict(cached[1])
+            return
+
+        try:
+            data = orjson.loads(self.REGISTRY_FILE.read_bytes())
+            self._registry = {pkg["name"]: SkillPackage(**pkg) for pkg in data}
+        except Exception as e:
+            logger.warning("registry_load_failed", error=str(e))
+            return
+        self._cache_registry(stamp)
+
+    def _registry_stamp(self) -> tuple[int, int]:
+        st = self.REGISTRY_FILE.stat()
+        return st.st_mtime_ns, st.st_size
+
+    def _cache_registry(self, stamp: tuple[int, int]) -> None:
+        with _REGISTRY_LOCK:
+            _REGISTRY_CACHE[self.REGISTRY_FILE] = (stamp, dict(self._registry))
 
     def _save_registry(self) -> None:
         """Save the local skill registry."""
@@ -100,40 +160,51 @@ class GulamaHub:
                 "dependencies": pkg.dependencies,
                 "tags": pkg.tags,
             }
-            for pkg in self._registry
+            for pkg in self._registry.values()
         ]
-        self.REGISTRY_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        self.REGISTRY_FILE.write_bytes(orjson.dumps(data))
+        self._cache_registry(self._registry_stamp())
+
+    def get(self, name: str) -> SkillPackage | None:
+        """Look up a registry package by name."""
+        return self._registry.get(name)
 
     def search(self, query: str = "", tag: str = "") -> list[SkillPackage]:
         """Search for skills in the registry."""
-        results = self._registry
+        results = list(self._registry.values())
         if query:
             q = query.lower()
-            results = [p for p in results if q in p.name.lower() or q in p.description.lower()]
+            results = [p for p in results if q in p._name_lc or q in p._desc_lc]
         if tag:
-            results = [p for p in results if tag.lower() in [t.lower() for t in p.tags]]
+            t = tag.lower()
+            results = [p for p in results if t in p._tags_lc]
         return results
 
     def list_installed(self) -> list[dict[str, str]]:
         """List installed community skills."""
         installed = []
-        for skill_dir in self.INSTALLED_DIR.iterdir():
-            if skill_dir.is_dir():
-                manifest_file = skill_dir / "manifest.json"
-                if manifest_file.exists():
-                    try:
-                        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
-                        installed.append(
-                            {
-                                "name": manifest.get("name", skill_dir.name),
-                                "version": manifest.get("version", "unknown"),
-                                "author": manifest.get("author", "unknown"),
-                            }
-                        )
-                    except Exception:
-                        installed.append(
-                            {"name": skill_dir.name, "version": "unknown", "author": "unknown"}
-                        )
+        # scandir reports entry types from the directory read itself, so
+        # non-symlink entries need no extra stat per skill
+        with os.scandir(self.INSTALLED_DIR) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                manifest_file = os.path.join(entry.path, "manifest.json")
+                try:
+                    manifest = _load_manifest(manifest_file, os.stat(manifest_file).st_mtime_ns)
+                    installed.append(
+                        {
+                            "name": manifest.get("name", entry.name),
+                            "version": manifest.get("version", "unknown"),
+                            "author": manifest.get("author", "unknown"),
+                        }
+                    )
+                except FileNotFoundError:
+                    continue
+                except Exception:
+                    installed.append(
+                        {"name": entry.name, "version": "unknown", "author": "unknown"}
+                    )
         return installed
 
     def verify_signature(self, file_path: Path, signature_hex: str, public_key_hex: str) -> bool:
@@ -142,18 +213,21 @@ class GulamaHub:
 
         MANDATORY for all community skill installations.
         """
-        try:
-            from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+        return self._read_verified(file_path, signature_hex, public_key_hex) is not None
 
-            public_key_bytes = bytes.fromhex(public_key_hex)
-            public_key = Ed25519PublicKey.from_public_bytes(public_key_bytes)
+    def _read_verified(
+        self, file_path: Path, signature_hex: str, public_key_hex: str
+    ) -> bytes | None:
+        """Read a file once and return its bytes if the signature checks out, else None."""
+        try:
+            public_key = _load_public_key(public_key_hex)
 
             file_content = file_path.read_bytes()
             signature_bytes = bytes.fromhex(signature_hex)
 
             public_key.verify(signature_bytes, file_content)
             logger.info("signature_verified", file=file_path.name)
-            return True
+            return file_content
 
         except Exception as e:
             logger.warning(
@@ -161,7 +235,17 @@ class GulamaHub:
                 file=file_path.name,
                 error=str(e),
             )
-            return False
+            return None
+
+    def verify_batch(self, items: list[tuple[Path, str, str]]) -> list[bool]:
+        """Verify many (file_path, signature_hex, public_key_hex) triples concurrently."""
+        return [content is not None for content in self._read_verified_many(items)]
+
+    def _read_verified_many(self, items: list[tuple[Path, str, str]]) -> list[bytes | None]:
+        if len(items) <= 1:
+            return [self._read_verified(*item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(VERIFY_WORKERS, len(items))) as pool:
+            return list(pool.map(lambda item: self._read_verified(*item), items))
 
     def install(
         self, skill_name: str, source_path: Path, signature_hex: str, public_key_hex: str
@@ -171,19 +255,41 @@ class GulamaHub:
 
         Returns True on success, False on verification failure.
         """
-        # Step 1: Verify signature (MANDATORY)
-        if not self.verify_signature(source_path, signature_hex, public_key_hex):
+        # Step 1: Verify signature (MANDATORY) — the verified bytes are reused below
+        content = self._read_verified(source_path, signature_hex, public_key_hex)
+        return self._place(skill_name, content, signature_hex, public_key_hex)
+
+    def install_many(self, specs: list[tuple[str, Path, str, str]]) -> list[bool]:
+        """
+        Install several community skills, verifying all signatures up front.
+
+        Each spec is (skill_name, source_path, signature_hex, public_key_hex).
+        Returns one success flag per spec, in order.
+        """
+        contents = self._read_verified_many([spec[1:] for spec in specs])
+        return [
+            self._place(name, content, signature_hex, public_key_hex)
+            for (name, _, signature_hex, public_key_hex), content in zip(
+                specs, contents, strict=True
+            )
+        ]
+
+    def _place(
+        self, skill_name: str, content: bytes | None, signature_hex: str, public_key_hex: str
+    ) -> bool:
+        """Write verified skill bytes and their manifest into the install directory."""
+        if content is None:
             logger.error("install_rejected", skill=skill_name, reason="signature_invalid")
             return False
 
-        # Step 2: Compute and record file hash
-        file_hash = hashlib.sha256(source_path.read_bytes()).hexdigest()
+        # Step 2: Compute and record hash of the exact bytes that were verified
+        file_hash = hashlib.sha256(content).hexdigest()
 
         # Step 3: Install to isolated directory
         install_dir = self.INSTALLED_DIR / skill_name
         install_dir.mkdir(parents=True, exist_ok=True)
 
-        shutil.copy2(source_path, install_dir / "skill.py")
+        (install_dir / "skill.py").write_bytes(content)
 
         manifest = {
             "name": skill_name,
@@ -194,10 +300,7 @@ class GulamaHub:
             "public_key": public_key_hex,
             "installed_at": datetime.now(UTC).isoformat(),
         }
-        (install_dir / "manifest.json").write_text(
-            json.dumps(manifest, indent=2),
-            encoding="utf-8",
-        )
+        (install_dir / "manifest.json").write_bytes(orjson.dumps(manifest))
 
         logger.info("skill_installed", name=skill_name, hash=file_hash[:16])
         return True
@@ -218,8 +321,8 @@ class GulamaHub:
             return False
 
         package.created_at = datetime.now(UTC).isoformat()
-        self._registry = [p for p in self._registry if p.name != package.name]
-        self._registry.append(package)
+        self._registry.pop(package.name, None)  # Re-publishing moves it to the end
+        self._registry[package.name] = package
         self._save_registry()
         logger.info("skill_published", name=package.name, version=package.version)
         return True
@@ -227,8 +330,6 @@ class GulamaHub:
     @staticmethod
     def generate_keypair() -> tuple[str, str]:
         """Generate an Ed25519 keypair for skill signing. Returns (private_key_hex, public_key_hex)."""
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-
         private_key = Ed25519PrivateKey.generate()
         public_key = private_key.public_key()
         return private_key.private_bytes_raw().hex(), public_key.public_bytes_raw().hex()
@@ -236,8 +337,6 @@ class GulamaHub:
     @staticmethod
     def sign_file(file_path: Path, private_key_hex: str) -> str:
         """Sign a file with Ed25519 private key. Returns signature hex string."""
-        from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
-
         private_bytes = bytes.fromhex(private_key_hex)
         private_key = Ed25519PrivateKey.from_private_bytes(private_bytes)
         file_content = file_path.read_bytes()
@@ -8,6 +8,8 @@ cryptographic signature verification before loading.
 
 from __future__ import annotations
 
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.skills.base import BaseSkill, SkillMetadata
@@ -15,6 +17,9 @@ from src.utils.logging import get_logger
 
 logger = get_logger("skill_registry")
 
+# Optional skill modules are imported concurrently at startup
+IMPORT_WORKERS = 8
+
 
 class SkillRegistry:
     """
@@ -26,6 +31,9 @@ class SkillRegistry:
 
     def __init__(self) -> None:
         self._skills: dict[str, BaseSkill] = {}
+        # Rebuilt only when a skill is registered, not on every LLM turn
+        self._tool_defs_cache: list[dict[str, Any]] | None = None
+        self._metadata_cache: list[SkillMetadata] | None = None
 
     def register(self, skill: BaseSkill) -> None:
         """Register a skill."""
@@ -36,6 +44,8 @@ class SkillRegistry:
             return
 
         self._skills[meta.name] = skill
+        self._tool_defs_cache = None
+        self._metadata_cache = None
         logger.info(
             "skill_registered",
             name=meta.name,
@@ -49,11 +59,15 @@ class SkillRegistry:
 
     def list_skills(self) -> list[SkillMetadata]:
         """List all registered skills."""
-        return [s.get_metadata() for s in self._skills.values()]
+        if self._metadata_cache is None:
+            self._metadata_cache = [s.get_metadata() for s in self._skills.values()]
+        return list(self._metadata_cache)
 
     def get_tool_definitions(self) -> list[dict[str, Any]]:
         """Get all tool definitions for LLM function calling."""
-        return [s.get_tool_definition() for s in self._skills.values()]
+        if self._tool_defs_cache is None:
+            self._tool_defs_cache = [s.get_tool_definition() for s in self._skills.values()]
+        return list(self._tool_defs_cache)
 
     def load_builtins(self) -> None:
         """Load all built-in skills."""
@@ -90,12 +104,17 @@ class SkillRegistry:
             ("self_modify", "src.skills.self_modifier", "SelfModifierSkill"),
         ]
 
-        for skill_name, module_path, class_name in optional_skills:
-            try:
-                import importlib
+        # Imports (disk reads, bytecode loads, module init) run in parallel;
+        # instantiation stays on this thread, in declaration order.
+        with ThreadPoolExecutor(max_workers=IMPORT_WORKERS) as pool:
+            futures = [
+                pool.submit(importlib.import_module, module_path)
+                for _, module_path, _ in optional_skills
+            ]
 
-                module = importlib.import_module(module_path)
-                skill_class = getattr(module, class_name)
+        for (skill_name, _, class_name), future in zip(optional_skills, futures, strict=True):
+            try:
+                skill_class = getattr(future.result(), class_name)
                 builtins.append(skill_class())
             except Exception:
                 logger.info("skill_skipped", name=skill_name, reason="module load failed")
@@ -12,16 +12,186 @@ Uses:
 
 from __future__ import annotations
 
-import json
-import subprocess
-from dataclasses import dataclass, field
+import asyncio
+import hashlib
+import os
+import re
+import threading
+import time
+import tomllib
+import weakref
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from src.constants import CACHE_DIR
 from src.utils.logging import get_logger
+from src.utils.platform import has_tool
+
+# Optional dependencies — resolved once at import, checked per call
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.utils import canonicalize_name
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    Requirement = None
 
 logger = get_logger("scanner")
 
+# pip treats "#" as a comment only at line start or after whitespace (URLs may contain "#")
+_REQ_COMMENT_RE = re.compile(r"(^|\s)#.*")
+
+
+def _iter_requirements(req_file: Path) -> Iterator[str]:
+    """Yield requirement specs line by line, without comments, markers or pip options."""
+    with req_file.open(encoding="utf-8") as f:
+        for line in f:
+            line = _REQ_COMMENT_RE.sub("", line).split(";", 1)[0].strip()
+            if line and not line.startswith("-"):
+                yield line
+
+
+_JSON_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError,)
+if ijson is not None:
+    _JSON_ERRORS += (ijson.JSONError,)
+
+
+def _stderr_text(stderr: bytes | BaseException) -> str:
+    return stderr.decode(errors="replace")[:200] if isinstance(stderr, bytes) else str(stderr)
+
+
+# Grype results are cached per skill-tree fingerprint so unchanged skills skip
+# Syft + Grype entirely. Entries expire so newly published CVEs are picked up.
+SCAN_CACHE_FILE = CACHE_DIR / "scan_cache.json"
+SCAN_CACHE_VERSION = 1
+SCAN_CACHE_TTL_SECONDS = 24 * 60 * 60
+SCAN_CACHE_MAX_ENTRIES = 256
+
+# Suspicious source patterns, matched in one pass per file by a compiled alternation
+DANGEROUS_PATTERNS: list[tuple[str, str]] = [
+    ("eval(", "Arbitrary code execution via eval()"),
+    ("exec(", "Arbitrary code execution via exec()"),
+    ("__import__", "Dynamic import (potential code injection)"),
+    ("compile(", "Dynamic code compilation"),
+    ("os.system(", "System command execution"),
+    ("subprocess.Popen(", "Process execution (should use sandbox)"),
+    ("ctypes", "C type access (potential escape)"),
+    ("pickle.loads(", "Unsafe deserialization"),
+    ("marshal.loads(", "Unsafe deserialization"),
+    ("webbrowser.open(", "Browser opening (potential phishing)"),
+]
+_DANGEROUS_RE = re.compile(b"|".join(re.escape(p.encode()) for p, _ in DANGEROUS_PATTERNS))
+# Every pattern contains "(" or is one of these literals; a file with none of them
+# cannot match, and the substring checks are far cheaper than the regex pass
+_SCAN_TRIGGERS = tuple(sorted({b"(" if "(" in p else p.encode() for p, _ in DANGEROUS_PATTERNS}))
+STATIC_SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+# Known vulnerable packages (basic check): "name<first_fixed_version" -> advisory
+KNOWN_VULNS: dict[str, dict[str, str]] = {
+    "pyyaml<6.0": {
+        "id": "CVE-2020-14343",
+        "severity": "critical",
+        "description": "Arbitrary code execution via yaml.load",
+    },
+    "requests<2.25.0": {
+        "id": "CVE-2023-32681",
+        "severity": "medium",
+        "description": "Information disclosure via proxy auth leak",
+    },
+    "urllib3<1.26.18": {
+        "id": "CVE-2023-45803",
+        "severity": "medium",
+        "description": "Request body leak on redirect",
+    },
+}
+
+
+def _build_vuln_index() -> dict[str, list[tuple[Any, dict[str, str]]]]:
+    """Index KNOWN_VULNS by normalized package name -> [(fixed_in, advisory)]."""
+    index: dict[str, list[tuple[Any, dict[str, str]]]] = {}
+    for pattern, info in KNOWN_VULNS.items():
+        name, bound = pattern.split("<", 1)
+        if Requirement is not None:
+            index.setdefault(canonicalize_name(name), []).append((Version(bound), info))
+        else:
+            index.setdefault(name.lower(), []).append((bound, info))
+    return index
+
+
+_VULN_INDEX = _build_vuln_index()
+
+# Specifier operators that put a floor under the allowed versions
+_LOWER_BOUND_OPS = frozenset({">=", ">", "==", "~=", "==="})
+
+# Parallel skill scans share this many concurrent Syft + Grype pipelines
+MAX_CONCURRENT_GRYPE = 4
+# asyncio primitives bind to the first loop that waits on them, so keep one per loop
+_GRYPE_SLOTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.BoundedSemaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _grype_slots() -> asyncio.BoundedSemaphore:
+    """The running loop's semaphore limiting concurrent Grype pipelines."""
+    loop = asyncio.get_running_loop()
+    slots = _GRYPE_SLOTS.get(loop)
+    if slots is None:
+        slots = _GRYPE_SLOTS[loop] = asyncio.BoundedSemaphore(MAX_CONCURRENT_GRYPE)
+    return slots
+
+
+# Cache writes run in worker threads; serialize their read-modify-write of the file
+_CACHE_LOCK = threading.Lock()
+
+# Grype keeps its vulnerability DB in a persistent directory. The DB is brought
+# up to date once per process; after that every scan skips the update check and
+# loads the DB straight from the (page-cached) files.
+GRYPE_DB_DIR = CACHE_DIR / "grype-db"
+_grype_db_checked = False
+_grype_db_ready = False
+
+
+# Grype reports up to this size are parsed in one go; larger ones are streamed
+GRYPE_STREAM_THRESHOLD = 64 * 1024
+
+
+class _PrefixedReader:
+    """Async reader that replays already-consumed bytes before the rest of a stream."""
+
+    def __init__(self, head: bytes, stream: asyncio.StreamReader) -> None:
+        self._head = head
+        self._stream = stream
+
+    async def read(self, n: int = -1) -> bytes:
+        if not self._head:
+            return await self._stream.read(n)
+        if n < 0:
+            head, self._head = self._head, b""
+            return head + await self._stream.read()
+        chunk, self._head = self._head[:n], self._head[n:]
+        return chunk
+
+
+def _tool_env() -> dict[str, str]:
+    """Environment for Syft/Grype runs. Explicit user settings take precedence."""
+    env = dict(os.environ)
+    env.setdefault("GRYPE_DB_CACHE_DIR", str(GRYPE_DB_DIR))
+    env.setdefault("GRYPE_CHECK_FOR_APP_UPDATE", "false")
+    env.setdefault("SYFT_CHECK_FOR_APP_UPDATE", "false")
+    if _grype_db_ready:
+        env.setdefault("GRYPE_DB_AUTO_UPDATE", "false")
+    return env
+
 
 @dataclass
 class Vulnerability:
@@ -58,25 +228,17 @@ class SkillScanner:
     4. Permission validation
     """
 
-    def __init__(self, max_critical: int = 0, max_high: int = 0):
+    def __init__(self, max_critical: int = 0, max_high: int = 0, use_cache: bool = True):
         self.max_critical = max_critical
         self.max_high = max_high
+        self.use_cache = use_cache
         self._syft_available = self._check_tool("syft")
         self._grype_available = self._check_tool("grype")
 
     @staticmethod
     def _check_tool(name: str) -> bool:
         """Check if a CLI tool is available."""
-        try:
-            subprocess.run(
-                [name, "version"],
-                capture_output=True,
-                timeout=5,
-                check=False,
-            )
-            return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return has_tool(name)
 
     async def scan_skill(self, skill_path: Path) -> ScanResult:
         """Run a full security scan on a skill."""
@@ -87,26 +249,27 @@ class SkillScanner:
             passed=True,
         )
 
-        # 1. Check manifest
-        manifest_result = self._check_manifest(skill_path)
-        result.warnings.extend(manifest_result)
-
-        # 2. Dependency analysis
-        dep_vulns = await self._scan_dependencies(skill_path)
+        # skill.toml is parsed once and shared by the manifest and dependency phases
+        manifest, manifest_error = await asyncio.to_thread(self._load_manifest, skill_path)
+
+        # The four phases are independent — run them concurrently:
+        # 1. manifest check, 2. dependency analysis, 3. SBOM + Grype, 4. static patterns
+        manifest_warnings, dep_vulns, grype_vulns, static_warnings = await asyncio.gather(
+            asyncio.to_thread(self._check_manifest, manifest, manifest_error),
+            self._scan_dependencies(skill_path, manifest),
+            self._grype_scan(skill_path)
+            if self._syft_available and self._grype_available
+            else asyncio.sleep(0, result=[]),
+            asyncio.to_thread(self._static_scan, skill_path),
+        )
+        result.warnings.extend(manifest_warnings)
         result.vulnerabilities.extend(dep_vulns)
-
-        # 3. SBOM + Grype scan
-        if self._syft_available and self._grype_available:
-            grype_vulns = await self._grype_scan(skill_path)
-            result.vulnerabilities.extend(grype_vulns)
-
-        # 4. Static pattern analysis
-        static_warnings = self._static_scan(skill_path)
+        result.vulnerabilities.extend(grype_vulns)
         result.warnings.extend(static_warnings)
 
-        # Determine pass/fail
-        critical_count = sum(1 for v in result.vulnerabilities if v.severity == "critical")
-        high_count = sum(1 for v in result.vulnerabilities if v.severity == "high")
+        # Determine pass/fail (one pass tallies every severity)
+        severities = Counter(v.severity for v in result.vulnerabilities)
+        critical_count, high_count = severities["critical"], severities["high"]
 
         if critical_count > self.max_critical or high_count > self.max_high:
             result.passed = False
@@ -115,6 +278,8 @@ class SkillScanner:
             "total_vulnerabilities": len(result.vulnerabilities),
             "critical": critical_count,
             "high": high_count,
+            "medium": severities["medium"],
+            "low": severities["low"],
             "syft_available": self._syft_available,
             "grype_available": self._grype_available,
         }
@@ -129,194 +294,341 @@ class SkillScanner:
 
         return result
 
-    def _check_manifest(self, skill_path: Path) -> list[str]:
-        """Validate skill manifest."""
-        warnings = []
-        manifest_path = skill_path / "skill.toml"
-
-        if not manifest_path.exists():
-            warnings.append("Missing skill.toml manifest")
-            return warnings
-
+    @staticmethod
+    def _load_manifest(skill_path: Path) -> tuple[dict[str, Any] | None, str]:
+        """Parse skill.toml, returning (data, error); data is None if missing or invalid."""
         try:
-            import tomli
-
-            with open(manifest_path, "rb") as f:
-                data = tomli.load(f)
-
-            skill = data.get("skill", {})
-            permissions = data.get("permissions", {})
+            with open(skill_path / "skill.toml", "rb") as f:
+                return tomllib.load(f), ""
+        except FileNotFoundError:
+            return None, ""
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            return None, str(e)
 
-            # Check required fields
-            for field_name in ["name", "version", "description", "author"]:
-                if field_name not in skill:
-                    warnings.append(f"Missing required field: skill.{field_name}")
-
-            # Check dangerous permissions
-            if permissions.get("shell", False):
-                warnings.append("Skill requests shell execution permission")
-            if permissions.get("network") == ["*"]:
-                warnings.append("Skill requests unrestricted network access")
-            if permissions.get("filesystem") == ["*"]:
-                warnings.append("Skill requests unrestricted filesystem access")
-
-            # Check for signature
-            if "signature" not in data:
-                warnings.append("Missing signature section in manifest")
+    @staticmethod
+    def _check_manifest(data: dict[str, Any] | None, error: str = "") -> list[str]:
+        """Validate a parsed skill manifest."""
+        if error:
+            return [f"Failed to parse manifest: {error}"]
+        if data is None:
+            return ["Missing skill.toml manifest"]
 
-        except Exception as e:
-            warnings.append(f"Failed to parse manifest: {e}")
+        warnings = []
+        skill = data.get("skill", {})
+        permissions = data.get("permissions", {})
+
+        # Check required fields
+        for field_name in ["name", "version", "description", "author"]:
+            if field_name not in skill:
+                warnings.append(f"Missing required field: skill.{field_name}")
+
+        # Check dangerous permissions
+        if permissions.get("shell", False):
+            warnings.append("Skill requests shell execution permission")
+        if permissions.get("network") == ["*"]:
+            warnings.append("Skill requests unrestricted network access")
+        if permissions.get("filesystem") == ["*"]:
+            warnings.append("Skill requests unrestricted filesystem access")
+
+        # Check for signature
+        if "signature" not in data:
+            warnings.append("Missing signature section in manifest")
 
         return warnings
 
-    async def _scan_dependencies(self, skill_path: Path) -> list[Vulnerability]:
-        """Scan Python dependencies for known vulnerabilities."""
+    async def _scan_dependencies(
+        self, skill_path: Path, manifest: dict[str, Any] | None = None
+    ) -> list[Vulnerability]:
+        """Scan Python dependencies for known vulnerabilities.
+
+        ``manifest`` is the already-parsed skill.toml; it is loaded here only
+        when the caller did not pass one.
+        """
         vulnerabilities = []
 
         # Check requirements.txt or skill.toml dependencies
-        deps = self._extract_dependencies(skill_path)
-
-        # Known vulnerable packages (basic check)
-        known_vulns: dict[str, dict[str, str]] = {
-            "pyyaml<6.0": {
-                "id": "CVE-2020-14343",
-                "severity": "critical",
-                "description": "Arbitrary code execution via yaml.load",
-            },
-            "requests<2.25.0": {
-                "id": "CVE-2023-32681",
-                "severity": "medium",
-                "description": "Information disclosure via proxy auth leak",
-            },
-            "urllib3<1.26.18": {
-                "id": "CVE-2023-45803",
-                "severity": "medium",
-                "description": "Request body leak on redirect",
-            },
-        }
+        if manifest is None:
+            manifest, _ = self._load_manifest(skill_path)
+        deps = self._extract_dependencies(skill_path, manifest)
 
         for dep in deps:
-            for pattern, vuln_info in known_vulns.items():
-                if dep.lower().startswith(pattern.split("<")[0]):
-                    vulnerabilities.append(
-                        Vulnerability(
-                            id=vuln_info["id"],
-                            severity=vuln_info["severity"],
-                            package=dep,
-                            version="",
-                            description=vuln_info["description"],
+            if Requirement is None:
+                # Without packaging, fall back to a plain name-prefix match
+                for name, advisories in _VULN_INDEX.items():
+                    if dep.lower().startswith(name):
+                        vulnerabilities.extend(
+                            self._dep_vulnerability(dep, "", info) for _, info in advisories
                         )
-                    )
+                continue
+
+            try:
+                req = Requirement(dep)
+            except InvalidRequirement:
+                continue  # Options like "-r other.txt" or "--hash" are not packages
+            pinned = next((s.version for s in req.specifier if s.operator in ("==", "===")), "")
+            for fixed_in, info in _VULN_INDEX.get(canonicalize_name(req.name), ()):
+                if self._allows_below(req, fixed_in):
+                    vulnerabilities.append(self._dep_vulnerability(dep, pinned, info))
 
         return vulnerabilities
 
+    @staticmethod
+    def _allows_below(req: Any, fixed_in: Any) -> bool:
+        """True unless the requirement's specifier keeps every version >= fixed_in."""
+        for spec in req.specifier:
+            if spec.operator not in _LOWER_BOUND_OPS:
+                continue
+            try:
+                floor = Version(spec.version.removesuffix(".*"))
+            except InvalidVersion:
+                continue
+            if floor >= fixed_in:
+                return False
+        return True
+
+    @staticmethod
+    def _dep_vulnerability(dep: str, version: str, info: dict[str, str]) -> Vulnerability:
+        return Vulnerability(
+            id=info["id"],
+            severity=info["severity"],
+            package=dep,
+            version=version,
+            description=info["description"],
+        )
+
     async def _grype_scan(self, skill_path: Path) -> list[Vulnerability]:
-        """Run Grype vulnerability scanner."""
-        vulnerabilities = []
+        """Run Grype vulnerability scanner, reusing cached results for unchanged skills."""
+        key = await asyncio.to_thread(self._fingerprint, skill_path) if self.use_cache else ""
+        if key:
+            cached = await asyncio.to_thread(self._cache_get, key)
+            if cached is not None:
+                logger.debug("scan_cache_hit", skill=skill_path.name)
+                return cached
+
+        async with _grype_slots():
+            vulnerabilities = await self._run_grype(skill_path)
+        if vulnerabilities is None:
+            return []
+        if key:
+            await asyncio.to_thread(self._cache_put, key, vulnerabilities)
+        return vulnerabilities
 
-        try:
-            # Generate SBOM with Syft
-            syft_result = subprocess.run(
-                ["syft", str(skill_path), "-o", "json"],
-                capture_output=True,
-                timeout=60,
-                check=False,
-            )
+    @staticmethod
+    async def _ensure_grype_db() -> None:
+        """Update Grype's DB once per process so later scans can skip the check."""
+        global _grype_db_checked, _grype_db_ready
 
-            if syft_result.returncode != 0:
-                logger.warning("syft_failed", stderr=syft_result.stderr.decode()[:200])
-                return []
-
-            # Scan with Grype
-            grype_result = subprocess.run(
-                ["grype", "--input", "-", "-o", "json"],
-                input=syft_result.stdout,
-                capture_output=True,
-                timeout=60,
-                check=False,
+        if _grype_db_checked:
+            return
+        _grype_db_checked = True  # concurrent first scans keep Grype's own auto-update
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "grype",
+                "db",
+                "update",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                env=_tool_env(),
             )
-
-            if grype_result.returncode != 0:
-                logger.warning("grype_failed", stderr=grype_result.stderr.decode()[:200])
-                return []
-
-            # Parse results
-            data = json.loads(grype_result.stdout)
-            for match in data.get("matches", []):
-                vuln = match.get("vulnerability", {})
-                artifact = match.get("artifact", {})
-                vulnerabilities.append(
-                    Vulnerability(
-                        id=vuln.get("id", "unknown"),
-                        severity=vuln.get("severity", "unknown").lower(),
-                        package=artifact.get("name", "unknown"),
-                        version=artifact.get("version", ""),
-                        fixed_in=vuln.get("fix", {}).get("versions", [""])[0]
-                        if vuln.get("fix")
-                        else "",
-                        description=vuln.get("description", "")[:200],
-                    )
+            try:
+                async with asyncio.timeout(300):
+                    _, stderr = await proc.communicate()
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+        except (TimeoutError, FileNotFoundError) as e:
+            logger.warning("grype_db_update_error", error=str(e))
+            return
+        if proc.returncode == 0:
+            _grype_db_ready = True
+        else:
+            logger.warning("grype_db_update_failed", stderr=_stderr_text(stderr))
+
+    async def _run_grype(self, skill_path: Path) -> list[Vulnerability] | None:
+        """Pipe a Syft SBOM into Grype and parse the matches. Returns None on failure."""
+        await self._ensure_grype_db()
+        env = _tool_env()
+        # Syft's stdout is connected to Grype's stdin with an OS pipe, so the two
+        # run side by side and the SBOM never passes through this process.
+        procs: list[asyncio.subprocess.Process] = []
+        read_fd, write_fd = os.pipe()
+        try:
+            try:
+                syft = await asyncio.create_subprocess_exec(
+                    "syft",
+                    str(skill_path),
+                    "-o",
+                    "json",
+                    "-q",
+                    stdout=write_fd,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
                 )
-
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
+                procs.append(syft)
+                grype = await asyncio.create_subprocess_exec(
+                    "grype",
+                    "-o",
+                    "json",
+                    "-q",
+                    stdin=read_fd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                )
+                procs.append(grype)
+            finally:
+                os.close(write_fd)
+                os.close(read_fd)
+
+            async with asyncio.timeout(120):
+                matches, syft_err, grype_err = await asyncio.gather(
+                    self._read_matches(grype.stdout),
+                    syft.stderr.read(),
+                    grype.stderr.read(),
+                    return_exceptions=True,
+                )
+                syft_rc, grype_rc = await asyncio.gather(syft.wait(), grype.wait())
+
+            if syft_rc != 0:
+                logger.warning("syft_failed", stderr=_stderr_text(syft_err))
+                return None
+            if grype_rc != 0:
+                logger.warning("grype_failed", stderr=_stderr_text(grype_err))
+                return None
+            if isinstance(matches, BaseException):
+                raise matches
+            return matches
+
+        except (TimeoutError, FileNotFoundError, *_JSON_ERRORS) as e:
             logger.warning("grype_scan_error", error=str(e))
+            return None
+        finally:
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+
+    @classmethod
+    async def _read_matches(cls, stream: asyncio.StreamReader) -> list[Vulnerability]:
+        """Parse Grype's JSON report.
+
+        Reports that fit in GRYPE_STREAM_THRESHOLD bytes are parsed in one
+        orjson call; larger ones are streamed one match at a time with ijson
+        (or read whole and parsed with orjson when ijson is not installed).
+        """
+        try:
+            head = await stream.readexactly(GRYPE_STREAM_THRESHOLD)
+        except asyncio.IncompleteReadError as e:
+            data = orjson.loads(e.partial)
+        else:
+            if ijson is not None:
+                source = _PrefixedReader(head, stream)
+                return [
+                    cls._parse_match(m) async for m in ijson.items_async(source, "matches.item")
+                ]
+            data = orjson.loads(head + await stream.read())
+        return [cls._parse_match(m) for m in data.get("matches", [])]
 
-        return vulnerabilities
+    @staticmethod
+    def _parse_match(match: dict[str, Any]) -> Vulnerability:
+        vuln = match.get("vulnerability", {})
+        artifact = match.get("artifact", {})
+        return Vulnerability(
+            id=vuln.get("id", "unknown"),
+            severity=vuln.get("severity", "unknown").lower(),
+            package=artifact.get("name", "unknown"),
+            version=artifact.get("version", ""),
+            fixed_in=vuln.get("fix", {}).get("versions", [""])[0] if vuln.get("fix") else "",
+            description=vuln.get("description", "")[:200],
+        )
+
+    @staticmethod
+    def _fingerprint(skill_path: Path) -> str:
+        """Hash (relative path, mtime, size) of every file in the skill tree."""
+        h = hashlib.sha256()
+        for path in sorted(p for p in skill_path.rglob("*") if p.is_file()):
+            st = path.stat()
+            rel = path.relative_to(skill_path).as_posix()
+            h.update(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def _cache_load() -> dict[str, Any]:
+        try:
+            data = orjson.loads(SCAN_CACHE_FILE.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        if data.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def _cache_get(self, key: str) -> list[Vulnerability] | None:
+        entry = self._cache_load().get(key)
+        if entry is None or time.time() - entry["ts"] > SCAN_CACHE_TTL_SECONDS:
+            return None
+        return [Vulnerability(**v) for v in entry["vulnerabilities"]]
+
+    def _cache_put(self, key: str, vulnerabilities: list[Vulnerability]) -> None:
+        with _CACHE_LOCK:
+            entries = self._cache_load()
+            vulns = [asdict(v) for v in vulnerabilities]
+            entries[key] = {"ts": time.time(), "vulnerabilities": vulns}
+            if len(entries) > SCAN_CACHE_MAX_ENTRIES:
+                by_age = sorted(entries.items(), key=lambda kv: kv[1]["ts"])
+                entries = dict(by_age[-SCAN_CACHE_MAX_ENTRIES:])
+            try:
+                SCAN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                tmp = SCAN_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_bytes(orjson.dumps({"version": SCAN_CACHE_VERSION, "entries": entries}))
+                os.replace(tmp, SCAN_CACHE_FILE)
+            except OSError as e:
+                logger.warning("scan_cache_write_failed", error=str(e))
 
     def _static_scan(self, skill_path: Path) -> list[str]:
         """Static analysis for suspicious code patterns."""
-        warnings = []
+        py_files = list(skill_path.rglob("*.py"))
+        if len(py_files) <= 1:
+            results = [self._scan_file(f) for f in py_files]
+        else:
+            with ThreadPoolExecutor(max_workers=STATIC_SCAN_WORKERS) as pool:
+                results = list(pool.map(self._scan_file, py_files))
+        return [warning for file_warnings in results for warning in file_warnings]
 
-        for py_file in skill_path.rglob("*.py"):
+    @staticmethod
+    def _scan_file(py_file: Path) -> list[str]:
+        """Match one file's raw bytes against the dangerous patterns (all ASCII)."""
+        content = py_file.read_bytes()
+        if not content.isascii():
             try:
-                content = py_file.read_text(encoding="utf-8")
+                content.decode("utf-8")
             except UnicodeDecodeError:
-                warnings.append(f"{py_file.name}: Non-UTF-8 encoding")
-                continue
+                return [f"{py_file.name}: Non-UTF-8 encoding"]
+        if not any(trigger in content for trigger in _SCAN_TRIGGERS):
+            return []
 
-            dangerous_patterns = [
-                ("eval(", "Arbitrary code execution via eval()"),
-                ("exec(", "Arbitrary code execution via exec()"),
-                ("__import__", "Dynamic import (potential code injection)"),
-                ("compile(", "Dynamic code compilation"),
-                ("os.system(", "System command execution"),
-                ("subprocess.Popen(", "Process execution (should use sandbox)"),
-                ("ctypes", "C type access (potential escape)"),
-                ("pickle.loads(", "Unsafe deserialization"),
-                ("marshal.loads(", "Unsafe deserialization"),
-                ("webbrowser.open(", "Browser opening (potential phishing)"),
-            ]
-
-            for pattern, description in dangerous_patterns:
-                if pattern in content:
-                    warnings.append(f"{py_file.name}: {description}")
-
-        return warnings
+        found = {m.decode() for m in _DANGEROUS_RE.findall(content)}
+        return [
+            f"{py_file.name}: {description}"
+            for pattern, description in DANGEROUS_PATTERNS
+            if pattern in found
+        ]
 
     @staticmethod
-    def _extract_dependencies(skill_path: Path) -> list[str]:
-        """Extract dependencies from a skill."""
+    def _extract_dependencies(skill_path: Path, manifest: dict[str, Any] | None) -> list[str]:
+        """Extract dependencies from requirements.txt and the parsed skill.toml."""
         deps = []
 
         # From requirements.txt
         req_file = skill_path / "requirements.txt"
         if req_file.exists():
-            for line in req_file.read_text().strip().split("\n"):
-                line = line.strip()
-                if line and not line.startswith("#"):
-                    deps.append(line)
+            deps.extend(_iter_requirements(req_file))
 
         # From skill.toml
-        manifest = skill_path / "skill.toml"
-        if manifest.exists():
-            try:
-                import tomli
-
-                with open(manifest, "rb") as f:
-                    data = tomli.load(f)
-                python_deps = data.get("dependencies", {}).get("python", [])
+        if manifest:
+            python_deps = manifest.get("dependencies", {}).get("python", [])
+            if isinstance(python_deps, list):
                 deps.extend(python_deps)
-            except Exception:
-                pass
 
         return deps
@@ -12,9 +12,18 @@ All self-authored skills:
 
 from __future__ import annotations
 
+import ast
+import asyncio
+import functools
 import importlib.util
+import os
+import re
+import shutil
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 from src.constants import SKILLS_DIR
@@ -24,6 +33,143 @@ from src.utils.logging import get_logger
 logger = get_logger("self_modifier")
 
 AUTHORED_DIR = SKILLS_DIR / "authored"
+LOAD_WORKERS = 4
+
+# Secret-material patterns the AST pass cannot see (they live in string literals)
+_SECRET_PATTERNS = {
+    ".ssh/": "SSH key access not allowed",
+    "PRIVATE KEY": "Private key access not allowed",
+    "BEGIN RSA": "Private key access not allowed",
+    "BEGIN EC": "Private key access not allowed",
+}
+_SECRET_RE = re.compile("|".join(re.escape(p) for p in _SECRET_PATTERNS))
+
+# Loaded skill classes keyed by file path, validated by (mtime_ns, size)
+_CLASS_CACHE: dict[Path, tuple[tuple[int, int], type[BaseSkill]]] = {}
+
+
+def _load_skill_class(name: str, path: Path) -> type[BaseSkill] | None:
+    """Import a skill file and return the BaseSkill subclass it defines.
+
+    Only classes defined in the file itself count (imported skills are
+    ignored); direct and indirect subclasses both qualify, and the most
+    derived one wins over intermediate bases. Unchanged files are served from
+    ``_CLASS_CACHE`` without being executed again; across restarts, the
+    source loader reuses the bytecode it cached in __pycache__.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CLASS_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    if not spec or not spec.loader:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    defined = [
+        c
+        for c in vars(module).values()
+        if isinstance(c, type) and issubclass(c, BaseSkill) and c.__module__ == module.__name__
+    ]
+    # Skip intermediate bases that another class in the file derives from
+    leaves = [c for c in defined if not any(o is not c and issubclass(o, c) for o in defined)]
+    if not leaves:
+        return None
+    _CLASS_CACHE[path] = (stamp, leaves[0])
+    return leaves[0]
+
+
+_BLOCKED_CALLS = frozenset({"eval", "exec", "compile", "__import__", "breakpoint"})
+_BLOCKED_ATTR_CALLS = frozenset({"system", "popen", "exec_module", "call", "run", "Popen"})
+_BLOCKED_MODULES = frozenset(
+    {
+        "subprocess",
+        "ctypes",
+        "os",
+        "shutil",
+        "signal",
+        "socket",
+        "multiprocessing",
+        "webbrowser",
+        "builtins",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _CodeAnalysis:
+    """Everything _security_scan and _validate_skill_code need from one AST walk."""
+
+    syntax_error: bool = False
+    violation: str | None = None
+    has_class: bool = False
+    inherits_base_skill: bool = False
+    methods: frozenset[str] = frozenset()
+    async_methods: frozenset[str] = frozenset()
+
+
+@functools.lru_cache(maxsize=64)
+def _analyze_code(code: str) -> _CodeAnalysis:
+    """Parse skill code once and collect security and structure facts.
+
+    Cached by source text, so the create/update path (scan, then validate)
+    and repeated edit-test loops parse each revision only once.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return _CodeAnalysis(syntax_error=True)
+
+    violation: str | None = None
+    has_class = inherits = False
+    methods: set[str] = set()
+    async_methods: set[str] = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            has_class = True
+            for base in node.bases:
+                name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", "")
+                inherits = inherits or name == "BaseSkill"
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef):
+                    methods.add(item.name)
+                elif isinstance(item, ast.AsyncFunctionDef):
+                    async_methods.add(item.name)
+        if violation:
+            continue
+
+        # Block dangerous function calls
+        if isinstance(node, ast.Call):
+            func = node.func
+            # Direct calls: eval(), exec(), compile(), __import__()
+            if isinstance(func, ast.Name) and func.id in _BLOCKED_CALLS:
+                violation = f"{func.id}() not allowed"
+            # Attribute calls: os.system(), subprocess.run(), etc.
+            elif isinstance(func, ast.Attribute) and func.attr in _BLOCKED_ATTR_CALLS:
+                violation = f".{func.attr}() not allowed"
+        # Block reaching builtins indirectly, e.g. getattr(__builtins__, "ev" + "al")
+        elif isinstance(node, ast.Name) and node.id == "__builtins__":
+            violation = "__builtins__ access not allowed"
+        # Block dangerous imports
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split(".")[0] in _BLOCKED_MODULES:
+                    violation = f"Import of '{alias.name}' not allowed"
+                    break
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and node.module.split(".")[0] in _BLOCKED_MODULES:
+                violation = f"Import from '{node.module}' not allowed"
+
+    return _CodeAnalysis(
+        violation=violation,
+        has_class=has_class,
+        inherits_base_skill=inherits,
+        methods=frozenset(methods),
+        async_methods=frozenset(async_methods),
+    )
 
 
 class SelfModifierSkill(BaseSkill):
@@ -107,7 +253,7 @@ class SelfModifierSkill(BaseSkill):
                 success=False, output="", error="skill_name must be alphanumeric with underscores"
             )
 
-        danger = self._security_scan(code)
+        danger = await asyncio.to_thread(self._security_scan, code)
         if danger:
             return SkillResult(success=False, output="", error=f"Security violation: {danger}")
 
@@ -117,7 +263,7 @@ class SelfModifierSkill(BaseSkill):
                 success=False, output="", error=f"Skill '{skill_name}' exists. Use 'update'."
             )
 
-        validation = self._validate_skill_code(code)
+        validation = await asyncio.to_thread(self._validate_skill_code, code)
         if not validation["valid"]:
             return SkillResult(
                 success=False, output="", error=f"Invalid code: {validation['error']}"
@@ -130,7 +276,7 @@ class SelfModifierSkill(BaseSkill):
             Created: {datetime.now(UTC).isoformat()}
             """
         ''')
-        skill_file.write_text(header + "\n" + code, encoding="utf-8")
+        await asyncio.to_thread(skill_file.write_text, header + "\n" + code, encoding="utf-8")
         logger.info("skill_created", name=skill_name)
         return SkillResult(
             success=True, output=f"Skill '{skill_name}' created. Use 'test' to verify."
@@ -142,17 +288,17 @@ class SelfModifierSkill(BaseSkill):
         skill_file = AUTHORED_DIR / f"{skill_name}.py"
         if not skill_file.exists():
             return SkillResult(success=False, output="", error=f"Skill '{skill_name}' not found.")
-        danger = self._security_scan(code)
+        danger = await asyncio.to_thread(self._security_scan, code)
         if danger:
             return SkillResult(success=False, output="", error=f"Security violation: {danger}")
-        validation = self._validate_skill_code(code)
+        validation = await asyncio.to_thread(self._validate_skill_code, code)
         if not validation["valid"]:
             return SkillResult(
                 success=False, output="", error=f"Invalid code: {validation['error']}"
             )
 
         backup = AUTHORED_DIR / f"{skill_name}.py.bak"
-        backup.write_text(skill_file.read_text(encoding="utf-8"), encoding="utf-8")
+        await asyncio.to_thread(shutil.copyfile, skill_file, backup)
 
         header = textwrap.dedent(f'''\
             """
@@ -160,7 +306,7 @@ class SelfModifierSkill(BaseSkill):
             Updated: {datetime.now(UTC).isoformat()}
             """
         ''')
-        skill_file.write_text(header + "\n" + code, encoding="utf-8")
+        await asyncio.to_thread(skill_file.write_text, header + "\n" + code, encoding="utf-8")
         logger.info("skill_updated", name=skill_name)
         return SkillResult(
             success=True, output=f"Skill '{skill_name}' updated. Old version backed up."
@@ -182,6 +328,8 @@ class SelfModifierSkill(BaseSkill):
             return SkillResult(success=False, output="", error=f"Skill '{skill_name}' not found.")
         skill_file.unlink()
         (AUTHORED_DIR / f"{skill_name}.py.bak").unlink(missing_ok=True)
+        # The source loader caches bytecode in __pycache__; drop it with the source
+        Path(importlib.util.cache_from_source(str(skill_file))).unlink(missing_ok=True)
         return SkillResult(success=True, output=f"Skill '{skill_name}' deleted.")
 
     async def _get(self, skill_name: str = "", **_: Any) -> SkillResult:
@@ -199,17 +347,7 @@ class SelfModifierSkill(BaseSkill):
         if not skill_file.exists():
             return SkillResult(success=False, output="", error=f"Skill '{skill_name}' not found.")
         try:
-            spec = importlib.util.spec_from_file_location(skill_name, skill_file)
-            if not spec or not spec.loader:
-                return SkillResult(success=False, output="", error="Could not load module.")
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            skill_class = None
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, BaseSkill) and attr is not BaseSkill:
-                    skill_class = attr
-                    break
+            skill_class = await asyncio.to_thread(_load_skill_class, skill_name, skill_file)
             if not skill_class:
                 return SkillResult(success=False, output="", error="No BaseSkill subclass found.")
             instance = skill_class()
@@ -230,84 +368,55 @@ class SelfModifierSkill(BaseSkill):
 
     def _security_scan(self, code: str) -> str | None:
         """Scan code for dangerous patterns using AST analysis + string fallback."""
-        import ast
-
         # First pass: AST-based analysis (cannot be trivially bypassed with string tricks)
-        try:
-            tree = ast.parse(code)
-            for node in ast.walk(tree):
-                # Block dangerous function calls
-                if isinstance(node, ast.Call):
-                    func = node.func
-                    # Direct calls: eval(), exec(), compile(), __import__()
-                    if isinstance(func, ast.Name) and func.id in (
-                        "eval", "exec", "compile", "__import__", "breakpoint",
-                    ):
-                        return f"{func.id}() not allowed"
-                    # Attribute calls: os.system(), subprocess.run(), etc.
-                    if isinstance(func, ast.Attribute) and func.attr in (
-                        "system", "popen", "exec_module", "call", "run", "Popen",
-                    ):
-                        return f".{func.attr}() not allowed"
-
-                # Block dangerous imports
-                if isinstance(node, (ast.Import, ast.ImportFrom)):
-                    blocked_modules = {
-                        "subprocess", "ctypes", "os", "shutil", "signal",
-                        "socket", "multiprocessing", "webbrowser",
-                    }
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            if alias.name.split(".")[0] in blocked_modules:
-                                return f"Import of '{alias.name}' not allowed"
-                    elif node.module and node.module.split(".")[0] in blocked_modules:
-                        return f"Import from '{node.module}' not allowed"
-        except SyntaxError:
+        analysis = _analyze_code(code)
+        if analysis.syntax_error:
             return "Code contains syntax errors"
+        if analysis.violation:
+            return analysis.violation
 
-        # Second pass: string patterns for things AST might miss
-        string_patterns = [
-            (".ssh/", "SSH key access not allowed"),
-            ("PRIVATE KEY", "Private key access not allowed"),
-            ("BEGIN RSA", "Private key access not allowed"),
-            ("BEGIN EC", "Private key access not allowed"),
-        ]
-        for pattern, reason in string_patterns:
-            if pattern in code:
-                return reason
+        # Second pass: string patterns for things AST might miss (one regex pass)
+        match = _SECRET_RE.search(code)
+        if match:
+            return _SECRET_PATTERNS[match.group()]
         return None
 
     def _validate_skill_code(self, code: str) -> dict[str, Any]:
-        required = ["class ", "def get_metadata", "def get_tool_definition", "async def execute"]
-        for pattern in required:
-            if pattern not in code:
-                return {"valid": False, "error": f"Missing: {pattern}"}
-        if "BaseSkill" not in code:
+        analysis = _analyze_code(code)
+        if analysis.syntax_error:
+            return {"valid": False, "error": "Code contains syntax errors"}
+        if not analysis.has_class:
+            return {"valid": False, "error": "Missing: class "}
+        for method in ("get_metadata", "get_tool_definition"):
+            if method not in analysis.methods:
+                return {"valid": False, "error": f"Missing: def {method}"}
+        if "execute" not in analysis.async_methods:
+            return {"valid": False, "error": "Missing: async def execute"}
+        if not analysis.inherits_base_skill:
             return {"valid": False, "error": "Must inherit from BaseSkill"}
         return {"valid": True, "error": ""}
 
     def load_authored_skills(self) -> list[BaseSkill]:
         """Load all authored skills for registration."""
+        with os.scandir(AUTHORED_DIR) as it:
+            files = sorted(
+                Path(e.path)
+                for e in it
+                if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+            )
+
+        # Module loads (disk reads, compilation, exec) run in parallel;
+        # instantiation stays on this thread, in file-name order.
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+            futures = [pool.submit(_load_skill_class, f.stem, f) for f in files]
+
         skills = []
-        for skill_file in AUTHORED_DIR.glob("*.py"):
-            if skill_file.name.startswith("_"):
-                continue
+        for skill_file, future in zip(files, futures, strict=True):
             try:
-                spec = importlib.util.spec_from_file_location(skill_file.stem, skill_file)
-                if not spec or not spec.loader:
-                    continue
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, BaseSkill)
-                        and attr is not BaseSkill
-                    ):
-                        skills.append(attr())
-                        logger.info("authored_skill_loaded", name=skill_file.stem)
-                        break
+                skill_class = future.result()
+                if skill_class:
+                    skills.append(skill_class())
+                    logger.info("authored_skill_loaded", name=skill_file.stem)
             except Exception as e:
                 logger.warning("authored_skill_load_failed", file=skill_file.name, error=str(e))
         return skills
@@ -10,17 +10,64 @@ Usage:
 
 from __future__ import annotations
 
+import gzip
 import hashlib
+import os
 import subprocess
 import tarfile
 import tempfile
+import tomllib
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 from src.utils.logging import get_logger
+from src.utils.platform import has_tool
 
 logger = get_logger("skill_signer")
 
+# gzip level for packages. A package only exists to be hashed and signed, so
+# favour speed over size (level 1 is ~1.5x faster than 6, ~30% larger)
+PACKAGE_COMPRESSLEVEL = 1
+
+
+class _HashingWriter:
+    """File wrapper that SHA-256s bytes as they are written."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        return self._f.write(data)
+
+    def flush(self) -> None:
+        self._f.flush()
+
+
+def _iter_package_files(root: str) -> Iterator[str]:
+    """Yield files under root in sorted order, pruning hidden entries and __pycache__."""
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.name.startswith(".") or entry.name == "__pycache__":
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_package_files(entry.path)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _normalize_tarinfo(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Strip owner, timestamp and extra mode bits so equal trees archive identically."""
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    info.mtime = 0
+    info.mode &= 0o755
+    return info
+
 
 @dataclass
 class SigningResult:
@@ -53,28 +100,33 @@ class SkillSigner:
 
     @staticmethod
     def _check_tool(name: str) -> bool:
-        try:
-            subprocess.run([name, "version"], capture_output=True, timeout=5, check=False)
-            return True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        return has_tool(name)
 
     def package_skill(self, skill_dir: Path, output_path: Path) -> str:
         """Package a skill directory into a tar.gz archive."""
         if not skill_dir.is_dir():
             raise FileNotFoundError(f"Skill directory not found: {skill_dir}")
 
-        with tarfile.open(output_path, "w:gz") as tar:
-            for item in skill_dir.rglob("*"):
-                if item.is_file():
-                    # Skip hidden files and __pycache__
-                    if any(part.startswith(".") or part == "__pycache__" for part in item.parts):
-                        continue
-                    arcname = str(item.relative_to(skill_dir.parent))
-                    tar.add(item, arcname=arcname)
-
-        # Compute hash
-        sha256 = self._compute_hash(output_path)
+        # Hash the archive as it is written instead of re-reading it afterwards.
+        # Entries are sorted and normalized, and the gzip header carries no name or
+        # timestamp, so the same tree yields the same hash on every machine.
+        base = skill_dir.parent
+        with open(output_path, "wb") as raw:
+            writer = _HashingWriter(raw)
+            with (
+                gzip.GzipFile(
+                    filename="",
+                    mode="wb",
+                    fileobj=writer,
+                    compresslevel=PACKAGE_COMPRESSLEVEL,
+                    mtime=0,
+                ) as gz,
+                tarfile.open(fileobj=gz, mode="w") as tar,
+            ):
+                for path in _iter_package_files(str(skill_dir)):
+                    tar.add(path, arcname=os.path.relpath(path, base), filter=_normalize_tarinfo)
+
+        sha256 = writer.sha256.hexdigest()
         logger.info("skill_packaged", path=str(output_path), sha256=sha256[:16] + "...")
         return sha256
 
@@ -88,17 +140,18 @@ class SkillSigner:
         name = skill_dir.name
         version = "0.0.0"
 
+        data: dict | None = None
+
+        # Parsed once here and reused when the signature is written back
         if manifest_path.exists():
             try:
-                import tomli
-
                 with open(manifest_path, "rb") as f:
-                    data = tomli.load(f)
+                    data = tomllib.load(f)
                 skill = data.get("skill", {})
                 name = skill.get("name", name)
                 version = skill.get("version", version)
             except Exception:
-                pass
+                data = None
 
         # Package
         package_path = output_dir / f"{name}-{version}.tar.gz"
@@ -129,7 +182,8 @@ class SkillSigner:
             result.signature_path = str(sig_path)
 
         # Update manifest with signature
-        self._update_manifest(manifest_path, sha256)
+        if data is not None:
+            self._update_manifest(manifest_path, sha256, data)
 
         logger.info(
             "skill_signed",
@@ -176,28 +230,16 @@ class SkillSigner:
     @staticmethod
     def _compute_hash(filepath: Path) -> str:
         """Compute SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     @staticmethod
-    def _update_manifest(manifest_path: Path, sha256: str) -> None:
-        """Update skill.toml with signing information."""
-        if not manifest_path.exists():
-            return
-
+    def _update_manifest(manifest_path: Path, sha256: str, data: dict) -> None:
+        """Write signing information into the already-parsed skill.toml."""
         try:
-            import tomli
             import tomli_w
 
-            with open(manifest_path, "rb") as f:
-                data = tomli.load(f)
-
-            if "signature" not in data:
-                data["signature"] = {}
-            data["signature"]["sha256"] = sha256
+            data.setdefault("signature", {})["sha256"] = sha256
 
             with open(manifest_path, "wb") as f:
                 tomli_w.dump(data, f)
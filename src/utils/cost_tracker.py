@@ -7,8 +7,12 @@ and alerts when spending approaches limits.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import asyncio
+import atexit
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from src.memory.store import MemoryStore
@@ -31,10 +35,47 @@ TOKEN_PRICING: dict[str, dict[str, float]] = {
     "ollama/*": {"input": 0.0, "output": 0.0},
 }
 
+# Cost entries are buffered and written to the memory store in batches: once
+# COST_FLUSH_BATCH entries are pending or COST_FLUSH_INTERVAL seconds have passed
+COST_FLUSH_BATCH = 32
+COST_FLUSH_INTERVAL = 5.0
 
-@dataclass
+# Below this fraction of the daily budget the local running total is trusted;
+# above it, every record re-reads the store before checking the budget
+BUDGET_RECONCILE_RATIO = 0.8
+
+# Live trackers, so buffered entries can be flushed on shutdown
+_TRACKERS: weakref.WeakSet[CostTracker] = weakref.WeakSet()
+
+# Last formatted timestamp, reused for every record within the same second
+_LAST_TS_SEC: int = 0
+_LAST_TS_STR: str = ""
+
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO string, at one-second resolution."""
+    global _LAST_TS_SEC, _LAST_TS_STR
+
+    sec = int(time.time())
+    if sec != _LAST_TS_SEC:
+        _LAST_TS_STR = datetime.fromtimestamp(sec, UTC).isoformat()
+        _LAST_TS_SEC = sec
+    return _LAST_TS_STR
+
+
+# Lookup tables derived from TOKEN_PRICING, as (input, output) price tuples:
+# exact "provider/model" keys, and wildcards ("ollama/*") keyed by prefix ("ollama/")
+_EXACT_PRICING: dict[str, tuple[float, float]] = {
+    k: (v["input"], v["output"]) for k, v in TOKEN_PRICING.items() if not k.endswith("/*")
+}
+_PREFIX_PRICING: dict[str, tuple[float, float]] = {
+    k[:-1]: (v["input"], v["output"]) for k, v in TOKEN_PRICING.items() if k.endswith("/*")
+}
+
+
+@dataclass(slots=True, frozen=True)
 class CostEntry:
-    """A single cost tracking entry."""
+    """A single cost tracking entry (immutable; slotted, since many may be buffered)."""
 
     provider: str
     model: str
@@ -67,6 +108,16 @@ class CostTracker:
         self.daily_budget_usd = daily_budget_usd
         self._session_cost: float = 0.0
         self._session_tokens: int = 0
+        self._session_stats: dict[str, Any] = {"session_cost_usd": 0.0, "session_tokens": 0}
+        self._pending: list[CostEntry] = []
+        self._last_flush: float = time.monotonic()
+        # Today's (UTC) spend including pending entries, loaded from the store once per day;
+        # _today_ends_at is the epoch time of the next UTC midnight
+        self._today_cost: float | None = None
+        self._today_ends_at: float = 0.0
+        # Timer that flushes entries still pending COST_FLUSH_INTERVAL after they were buffered
+        self._flush_timer: asyncio.TimerHandle | None = None
+        _TRACKERS.add(self)
 
     async def record(
         self,
@@ -93,32 +144,32 @@ class CostTracker:
             channel=channel,
             skill=skill,
             conversation_id=conversation_id,
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=_iso_now(),
         )
 
         # Update session totals
         self._session_cost += cost_usd
         self._session_tokens += input_tokens + output_tokens
 
-        # Persist to memory store
+        # Buffer for the memory store; budget is checked against the local total
         if self.memory_store:
-            try:
-                self.memory_store.record_cost(
-                    provider=provider,
-                    model=model,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    cost_usd=cost_usd,
-                    channel=channel,
-                    skill=skill,
-                    conversation_id=conversation_id,
+            today_cost = self._today_total() + cost_usd
+            self._today_cost = today_cost
+            self._pending.append(entry)
+            if today_cost >= BUDGET_RECONCILE_RATIO * self.daily_budget_usd:
+                # Near the limit: persist and re-read so other sessions' spend counts
+                self._flush_pending()
+                today_cost = self._today_cost = self.memory_store.get_today_cost()
+            elif (
+                len(self._pending) >= COST_FLUSH_BATCH
+                or time.monotonic() - self._last_flush >= COST_FLUSH_INTERVAL
+            ):
+                self._flush_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = asyncio.get_running_loop().call_later(
+                    COST_FLUSH_INTERVAL, self.flush
                 )
-            except Exception as e:
-                logger.warning("cost_persist_failed", error=str(e))
 
-        # Check budget
-        if self.memory_store:
-            today_cost = self.memory_store.get_today_cost()
             if today_cost >= self.daily_budget_usd:
                 logger.warning(
                     "daily_budget_exceeded",
@@ -137,6 +188,41 @@ class CostTracker:
 
         return entry
 
+    def flush(self) -> None:
+        """Write buffered cost entries to the memory store (also run by the idle timer).
+
+        The write stays on the caller's thread: the store's single connection is
+        shared with record() and the budget re-read, so it must not be used
+        from a worker thread concurrently.
+        """
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Persist pending entries in one batch."""
+        self._last_flush = time.monotonic()
+        if not self._pending or not self.memory_store:
+            return
+        entries, self._pending = self._pending, []
+        try:
+            self.memory_store.record_costs([asdict(e) for e in entries])
+        except Exception as e:
+            logger.warning("cost_persist_failed", error=str(e), entries=len(entries))
+
+    def _today_total(self) -> float:
+        """Today's spend: persisted total plus entries not yet flushed."""
+        if time.time() >= self._today_ends_at:
+            tomorrow = datetime.now(UTC).date() + timedelta(days=1)
+            self._today_ends_at = datetime(
+                tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=UTC
+            ).timestamp()
+            self._today_cost = None
+        if self._today_cost is None:
+            self._today_cost = self.memory_store.get_today_cost() if self.memory_store else 0.0
+        return self._today_cost
+
     @staticmethod
     def estimate_cost(
         provider: str,
@@ -147,25 +233,30 @@ class CostTracker:
         """Estimate the cost for a given number of tokens."""
         key = f"{provider}/{model}"
 
-        # Exact match
-        if key in TOKEN_PRICING:
-            pricing = TOKEN_PRICING[key]
-            return (input_tokens * pricing["input"]) + (output_tokens * pricing["output"])
-
-        # Wildcard match (e.g., ollama/*)
-        for pattern, pricing in TOKEN_PRICING.items():
-            if pattern.endswith("/*") and key.startswith(pattern[:-1]):
-                return (input_tokens * pricing["input"]) + (output_tokens * pricing["output"])
+        # Exact match, then wildcard match (e.g., ollama/*) on each "/"-prefix
+        pricing = _EXACT_PRICING.get(key)
+        slash = key.find("/")
+        while pricing is None and slash != -1:
+            pricing = _PREFIX_PRICING.get(key[: slash + 1])
+            slash = key.find("/", slash + 1)
+        if pricing is not None:
+            input_price, output_price = pricing
+            return (input_tokens * input_price) + (output_tokens * output_price)
 
         # Default: assume $0.002 per 1K tokens
         return ((input_tokens + output_tokens) / 1000) * 0.002
 
     def get_session_stats(self) -> dict[str, Any]:
-        """Get cost stats for the current session."""
-        return {
-            "session_cost_usd": round(self._session_cost, 6),
-            "session_tokens": self._session_tokens,
-        }
+        """Get cost stats for the current session.
+
+        The same dict is updated in place and returned on every call, so
+        frequent polling allocates nothing; treat it as read-only and copy it
+        to keep a snapshot.
+        """
+        stats = self._session_stats
+        stats["session_cost_usd"] = round(self._session_cost, 6)
+        stats["session_tokens"] = self._session_tokens
+        return stats
 
     def get_today_stats(self) -> dict[str, Any]:
         """Get today's cost summary."""
@@ -176,7 +267,7 @@ class CostTracker:
                 "remaining_usd": self.daily_budget_usd,
             }
 
-        today_cost = self.memory_store.get_today_cost()
+        today_cost = self._today_total()
         return {
             "today_cost_usd": round(today_cost, 6),
             "budget_usd": self.daily_budget_usd,
@@ -190,23 +281,30 @@ class CostTracker:
         """Get cost history for the last N days."""
         if not self.memory_store:
             return []
+        self._flush_pending()
         return self.memory_store.get_cost_summary(days)
 
     def is_budget_exceeded(self) -> bool:
         """Check if the daily budget has been exceeded."""
         if not self.memory_store:
             return False
-        return self.memory_store.get_today_cost() >= self.daily_budget_usd
+        return self._today_total() >= self.daily_budget_usd
 
     def get_dashboard_data(self) -> dict[str, Any]:
         """Get comprehensive dashboard data."""
         today = self.get_today_stats()
-        session = self.get_session_stats()
+        session = self.get_session_stats().copy()  # dashboards are snapshots
         history = self.get_history(days=30)
 
-        # Calculate weekly and monthly totals
-        weekly_cost = sum(day.get("total_cost", 0) for day in self.get_history(days=7))
-        monthly_cost = sum(day.get("total_cost", 0) for day in history)
+        # Calculate weekly and monthly totals in one pass; the last 7 days are a
+        # slice of the 30-day history (rows are per day/provider/model, keyed by "day")
+        week_start = (datetime.now(UTC) - timedelta(days=7)).date().isoformat()
+        weekly_cost = monthly_cost = 0.0
+        for day in history:
+            cost = day.get("total_cost") or 0.0
+            monthly_cost += cost
+            if (day.get("day") or "") >= week_start:
+                weekly_cost += cost
 
         return {
             "today": today,
@@ -215,3 +313,15 @@ class CostTracker:
             "monthly_cost_usd": round(monthly_cost, 4),
             "daily_history": history,
         }
+
+
+def flush_cost_trackers() -> None:
+    """Persist every live tracker's buffered entries (call on application shutdown)."""
+    for tracker in list(_TRACKERS):
+        tracker.flush()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    """Last-chance flush for processes that never ran flush_cost_trackers()."""
+    flush_cost_trackers()
@@ -0,0 +1,57 @@
+"""
+Shared HTTP client for Gulama skills.
+
+Skills that talk to the same APIs over and over (TTS/STT providers, web
+fetches) reuse one pooled httpx.AsyncClient so keep-alive connections are
+shared instead of paying a fresh TCP + TLS handshake on every call.
+
+A client is bound to the event loop that created it, so each loop (tests,
+CLI one-shots via asyncio.run) gets its own. Whoever owns a loop closes that
+loop's client with close_http_client() before the loop ends (the gateway
+does it on shutdown, the CLI when its chat loop exits).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import weakref
+
+import httpx
+
+from src.utils.logging import get_logger
+
+logger = get_logger("http_client")
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One client per event loop; weak keys so a discarded loop doesn't pin its entry
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared pooled client, creating it on first use in this loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=60.0,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=60,
+            ),
+        )
+        logger.debug("http_client_created", http2=_HTTP2_AVAILABLE)
+    return client
+
+
+async def close_http_client() -> None:
+    """Close this loop's shared client (call before the loop shuts down)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
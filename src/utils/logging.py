@@ -4,28 +4,67 @@ import re
 import sys
 from typing import Any
 
+import orjson
 import structlog
 
 from src.constants import SENSITIVE_PATTERNS
 
+# All patterns fused into one alternation, compiled once at import: redaction
+# runs on every field of every log line and now walks each string only once.
+# (The patterns are self-contained, with no backreferences, so fusing is safe.)
+_SENSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in SENSITIVE_PATTERNS))
+
+
+# Joins a log event's string fields for one redaction pass. \x1e is whitespace
+# to the regex engine, so no "\S+"-style pattern can run across two fields
+_FIELD_SEP = "\x1e"
+
 
 def _redact_secrets(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Processor that redacts sensitive data from all log fields."""
-    for key, value in list(event_dict.items()):
-        if isinstance(value, str):
-            event_dict[key] = _redact_string(value)
-        elif isinstance(value, dict):
-            event_dict[key] = {
-                k: _redact_string(v) if isinstance(v, str) else v for k, v in value.items()
-            }
+    _redact_fields(event_dict)
     return event_dict
 
 
 def _redact_string(text: str) -> str:
     """Replace any sensitive patterns found in text with [REDACTED]."""
-    for pattern in SENSITIVE_PATTERNS:
-        text = re.sub(pattern, "[REDACTED]", text)
-    return text
+    return _SENSITIVE_RE.sub("[REDACTED]", text)
+
+
+def _redact_fields(event_dict: dict[str, Any], _subn=_SENSITIVE_RE.subn) -> None:
+    """Redact every string field (and one level of nested dicts) in a single regex pass.
+
+    The string values are joined with _FIELD_SEP, substituted once and split
+    back. If a value contains the separator, or a match swallowed one, each
+    field is redacted on its own instead.
+    """
+    slots: list[tuple[dict[str, Any], str]] = []
+    values: list[str] = []
+    for key, value in event_dict.items():
+        if isinstance(value, str):
+            slots.append((event_dict, key))
+            values.append(value)
+        elif isinstance(value, dict):
+            value = event_dict[key] = dict(value)  # never mutate the caller's dict
+            for k, v in value.items():
+                if isinstance(v, str):
+                    slots.append((value, k))
+                    values.append(v)
+    if not values:
+        return
+
+    joined = _FIELD_SEP.join(values)
+    if joined.count(_FIELD_SEP) != len(values) - 1:  # a value contains the separator
+        parts = [_subn("[REDACTED]", v)[0] for v in values]
+    else:
+        redacted, count = _subn("[REDACTED]", joined)
+        if not count:
+            return
+        parts = redacted.split(_FIELD_SEP)
+        if len(parts) != len(values):  # a match ran across fields
+            parts = [_subn("[REDACTED]", v)[0] for v in values]
+    for (container, key), part in zip(slots, parts, strict=True):
+        container[key] = part
 
 
 def _add_project_info(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
@@ -34,6 +73,13 @@ def _add_project_info(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
     return event_dict
 
 
+def _add_info_and_redact(_, __, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """_add_project_info and _redact_secrets fused into one processor call."""
+    event_dict["service"] = "gulama"
+    _redact_fields(event_dict)
+    return event_dict
+
+
 def setup_logging(level: str = "INFO", json_format: bool = True) -> None:
     """
     Configure structured logging for Gulama.
@@ -48,26 +94,43 @@ def setup_logging(level: str = "INFO", json_format: bool = True) -> None:
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        _add_project_info,
-        _redact_secrets,  # CRITICAL: Always redact before output
+        _add_info_and_redact,  # CRITICAL: Always redact before output
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
     ]
 
-    if json_format:
-        processors.append(structlog.processors.JSONRenderer())
+    # JSON lines are serialized by orjson straight to bytes and written to the
+    # raw stderr buffer, skipping a str round-trip per line
+    stderr_buffer = getattr(sys.stderr, "buffer", None)
+    logger_factory: Any
+    if json_format and stderr_buffer is not None:
+        processors.append(
+            structlog.processors.JSONRenderer(
+                serializer=orjson.dumps, option=orjson.OPT_NON_STR_KEYS
+            )
+        )
+        logger_factory = structlog.BytesLoggerFactory(file=stderr_buffer)
+    elif json_format:
+        processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps_str))
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stderr)
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
+        logger_factory = structlog.PrintLoggerFactory(file=sys.stderr)
 
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(_level_to_int(level)),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stderr),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
+def _orjson_dumps_str(obj: Any, **kw: Any) -> str:
+    """orjson serializer for text-only streams (stderr without a byte buffer)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kw).decode()
+
+
 def get_logger(name: str = "") -> structlog.BoundLogger:
     """Get a logger instance. Secrets are automatically redacted."""
     logger = structlog.get_logger()
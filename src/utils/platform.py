@@ -1,5 +1,7 @@
 """Cross-platform detection utilities for Gulama."""
 
+import functools
+import os
 import platform
 import shutil
 from enum import StrEnum
@@ -21,6 +23,7 @@ class SandboxBackend(StrEnum):
     PROCESS = "process"  # Fallback: subprocess with resource limits
 
 
+@functools.cache
 def detect_os() -> OSType:
     """Detect the current operating system."""
     system = platform.system()
@@ -35,6 +38,7 @@ def detect_os() -> OSType:
             return OSType.UNKNOWN
 
 
+@functools.cache
 def detect_architecture() -> str:
     """Detect CPU architecture."""
     machine = platform.machine().lower()
@@ -47,24 +51,31 @@ def detect_architecture() -> str:
     return machine
 
 
+@functools.cache
+def has_tool(name: str) -> bool:
+    """Check whether a CLI tool is on PATH (PATH lookup only, cached per process)."""
+    return shutil.which(name) is not None
+
+
+@functools.cache
 def detect_best_sandbox() -> SandboxBackend:
     """Detect the best available sandbox backend for the current OS."""
     current_os = detect_os()
 
     match current_os:
         case OSType.LINUX:
-            if shutil.which("bwrap"):
+            if has_tool("bwrap"):
                 return SandboxBackend.BUBBLEWRAP
-            if shutil.which("runsc"):
+            if has_tool("runsc"):
                 return SandboxBackend.GVISOR
-            if shutil.which("docker"):
+            if has_tool("docker"):
                 return SandboxBackend.DOCKER
             return SandboxBackend.PROCESS
 
         case OSType.MACOS:
-            if shutil.which("sandbox-exec"):
+            if has_tool("sandbox-exec"):
                 return SandboxBackend.APPLE_SANDBOX
-            if shutil.which("docker"):
+            if has_tool("docker"):
                 return SandboxBackend.DOCKER
             return SandboxBackend.PROCESS
 
@@ -72,36 +83,28 @@ def detect_best_sandbox() -> SandboxBackend:
             # Check for Windows Sandbox (only on Pro/Enterprise)
             if _is_windows_sandbox_available():
                 return SandboxBackend.WINDOWS_SANDBOX
-            if shutil.which("docker"):
+            if has_tool("docker"):
                 return SandboxBackend.DOCKER
             return SandboxBackend.PROCESS
 
         case _:
-            if shutil.which("docker"):
+            if has_tool("docker"):
                 return SandboxBackend.DOCKER
             return SandboxBackend.PROCESS
 
 
+@functools.cache
 def _is_windows_sandbox_available() -> bool:
-    """Check if Windows Sandbox feature is available."""
+    """Check if Windows Sandbox feature is available.
+
+    Enabling the Containers-DisposableClientVM feature installs
+    WindowsSandbox.exe into System32, so a file check answers the question
+    without spawning PowerShell.
+    """
     if detect_os() != OSType.WINDOWS:
         return False
-    try:
-        import subprocess
-
-        result = subprocess.run(
-            [
-                "powershell",
-                "-Command",
-                "Get-WindowsOptionalFeature -Online -FeatureName Containers-DisposableClientVM",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        return "Enabled" in result.stdout
-    except Exception:
-        return False
+    system_root = os.environ.get("SYSTEMROOT", r"C:\Windows")
+    return os.path.isfile(os.path.join(system_root, "System32", "WindowsSandbox.exe"))
 
 
 def get_data_dir() -> str:
@@ -111,6 +114,7 @@ def get_data_dir() -> str:
     return str(DATA_DIR)
 
 
+@functools.cache
 def is_wsl() -> bool:
     """Check if running in Windows Subsystem for Linux."""
     if detect_os() != OSType.LINUX:
@@ -122,6 +126,7 @@ def is_wsl() -> bool:
         return False
 
 
+@functools.cache
 def get_keyring_backend() -> str:
     """Detect the best keyring backend for the current OS."""
     current_os = detect_os()
@@ -6,6 +6,14 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _test_mode():
+    """Flag test mode before any test (or xdist worker) builds the gateway."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GULAMA_TEST_MODE", "1")
+        yield
+
+
 @pytest.fixture
 def tmp_dir():
     """Provide a temporary directory for tests."""
@@ -0,0 +1,94 @@
+"""Shared fixtures for integration tests."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+from types import SimpleNamespace
+
+import pytest
+
+from src.security.egress_filter import EgressDecision
+
+
+@dataclass(frozen=True)
+class FakeResponse:
+    """One LLMRouter.chat() result, with the fields the brain reads."""
+
+    content: str = ""
+    tool_calls: list[dict] | None = None
+    input_tokens: int = 10
+    output_tokens: int = 20
+    cost_usd: float = 0.001
+    provider: str = "test"
+    model: str = "test-model"
+
+
+class FakeRouter:
+    """Stand-in for LLMRouter that plays back a script of responses.
+
+    Each chat() call pops the next entry; an exception in the script is raised.
+    """
+
+    def __init__(self, script=(), budget_ok: bool = True):
+        self.script = deque(script)
+        self.budget_ok = budget_ok
+        self.calls = 0
+
+    def check_budget(self, *args) -> bool:
+        return self.budget_ok
+
+    async def chat(self, messages, tools=None) -> dict:
+        self.calls += 1
+        step = self.script.popleft()
+        if isinstance(step, Exception):
+            raise step
+        return asdict(step)
+
+    async def stream(self, messages):
+        result = await self.chat(messages)
+        yield {"type": "chunk", "content": result["content"]}
+        yield {"type": "complete", **result}
+
+
+class NullAudit:
+    """AuditLogger that records nothing (no audit files are written)."""
+
+    def log(self, *args, **kwargs) -> None:
+        pass
+
+
+class NullCanary:
+    """CanarySystem that leaves tool output untouched."""
+
+    def inject_tool_canary(self, tool_output: str) -> tuple[str, None]:
+        return tool_output, None
+
+
+class NullEgress:
+    """EgressFilter that lets all data through without scanning it."""
+
+    def check_data(self, data: str) -> EgressDecision:
+        return EgressDecision(allowed=True, reason="Data approved.", blocked_patterns=[])
+
+
+@pytest.fixture(scope="session")
+def fake_router():
+    """Factory for scripted routers: ``brain._router = fake_router([resp1, resp2])``."""
+    return FakeRouter
+
+
+@pytest.fixture
+def make_store():
+    """Factory for MemoryStore stand-ins that hand out a fixed conversation id."""
+
+    def _make(conv_id: str = "conv-x") -> SimpleNamespace:
+        return SimpleNamespace(
+            open=lambda: None,
+            close=lambda: None,
+            create_conversation=lambda *a, **kw: conv_id,
+            add_message=lambda *a, **kw: None,
+            record_cost=lambda *a, **kw: None,
+        )
+
+    return _make
@@ -7,9 +7,9 @@ mocked LLM responses (no real API calls needed).
 
 from __future__ import annotations
 
-import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
+import jsonschema
 import pytest
 
 from src.agent.brain import AgentBrain
@@ -21,9 +21,50 @@ from src.security.egress_filter import EgressFilter
 from src.security.policy_engine import PolicyEngine
 from src.skills.base import BaseSkill, SkillMetadata, SkillResult
 from src.skills.registry import SkillRegistry
+from tests.integration.conftest import FakeResponse, NullAudit, NullCanary, NullEgress
 
 # ── Fixtures ──────────────────────────────────────────
 
+# OpenAI function-calling tool definition, compiled once for all skills
+_TOOL_DEF_VALIDATOR = jsonschema.Draft7Validator(
+    {
+        "type": "object",
+        "required": ["type", "function"],
+        "properties": {
+            "type": {"const": "function"},
+            "function": {
+                "type": "object",
+                "required": ["name", "description", "parameters"],
+                "properties": {
+                    "name": {"type": "string", "minLength": 1},
+                    "description": {"type": "string"},
+                    "parameters": {
+                        "type": "object",
+                        "required": ["type"],
+                        "properties": {"type": {"const": "object"}},
+                    },
+                },
+            },
+        },
+    }
+)
+
+_GREETING_RESP = FakeResponse(content="Hello! How can I help you?")
+_STREAM_RESP = FakeResponse(content="Streaming response")
+
+_ECHO_ARGS = '{"text": "hello from tool"}'
+_TOOL_CALL_RESP = FakeResponse(
+    tool_calls=[{"id": "call_1", "function": {"name": "test_echo", "arguments": _ECHO_ARGS}}],
+    input_tokens=15,
+    output_tokens=10,
+    cost_usd=0.0005,
+)
+_FINAL_RESP = FakeResponse(
+    content="I used the echo tool and it said: Echo: hello from tool",
+    input_tokens=25,
+    output_tokens=30,
+)
+
 
 class MockSkill(BaseSkill):
     """A simple test skill that echoes input."""
@@ -84,7 +125,17 @@ class FailingSkill(BaseSkill):
         }
 
 
-@pytest.fixture
+class _StubContext:
+    """Stand-in for ContextBuilder that returns a fixed message list."""
+
+    def __init__(self, messages):
+        self.messages = messages
+
+    def build_messages(self, *args, **kwargs):
+        return list(self.messages)
+
+
+@pytest.fixture(scope="session")
 def registry():
     """Create a registry with test skills."""
     reg = SkillRegistry()
@@ -93,18 +144,38 @@ def registry():
     return reg
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_executor(registry):
-    """Create a tool executor with test skills."""
+    """Create a tool executor with test skills and no-op security components."""
     return ToolExecutor(
         registry=registry,
         policy_engine=PolicyEngine(autonomy_level=4),  # Autopilot — allow everything
-        audit_logger=AuditLogger(),
+        audit_logger=NullAudit(),
+        canary_system=NullCanary(),
+        egress_filter=NullEgress(),
+    )
+
+
+@pytest.fixture(scope="session")
+def secure_tool_executor(registry, tmp_path_factory):
+    """Create a tool executor with the real audit, canary and egress components."""
+    return ToolExecutor(
+        registry=registry,
+        policy_engine=PolicyEngine(autonomy_level=4),
+        audit_logger=AuditLogger(audit_dir=tmp_path_factory.mktemp("audit")),
         canary_system=CanarySystem(),
         egress_filter=EgressFilter(),
     )
 
 
+@pytest.fixture(scope="module")
+def loaded_registry():
+    """Registry with all built-in skills, loaded once (read-only in tests)."""
+    reg = SkillRegistry()
+    reg.load_builtins()
+    return reg
+
+
 @pytest.fixture
 def config():
     """Create a test config."""
@@ -166,9 +237,9 @@ class TestToolExecutorPipeline:
         executor = ToolExecutor(
             registry=registry,
             policy_engine=PolicyEngine(autonomy_level=0),
-            audit_logger=AuditLogger(),
-            canary_system=CanarySystem(),
-            egress_filter=EgressFilter(),
+            audit_logger=NullAudit(),
+            canary_system=NullCanary(),
+            egress_filter=NullEgress(),
         )
 
         result = await executor.execute_tool_call(
@@ -188,51 +259,27 @@ class TestBrainIntegration:
     """Test the full brain → LLM → tool → response flow."""
 
     @pytest.mark.asyncio
-    async def test_brain_text_response(self, config):
+    async def test_brain_text_response(self, config, fake_router, make_store, monkeypatch):
         """Brain should return a text response when LLM doesn't call tools."""
         brain = AgentBrain(config=config, api_key="test-key")
 
-        # Mock the LLM router to return a simple text response
-        mock_router = MagicMock()
-        mock_router.chat = AsyncMock(
-            return_value={
-                "content": "Hello! How can I help you?",
-                "tool_calls": None,
-                "input_tokens": 10,
-                "output_tokens": 20,
-                "cost_usd": 0.001,
-                "provider": "test",
-                "model": "test-model",
-            }
-        )
-        mock_router.check_budget = MagicMock(return_value=True)
+        # Mock memory store
+        mock_store = make_store("conv-123")
 
-        # Mock the context builder
-        mock_ctx = MagicMock()
-        mock_ctx.build_messages = MagicMock(
-            return_value=[
+        brain._router = fake_router([_GREETING_RESP])
+        brain.context_builder = _StubContext(
+            [
                 {"role": "system", "content": "You are a helpful assistant."},
                 {"role": "user", "content": "Hello"},
             ]
         )
-
-        # Mock memory store
-        mock_store = MagicMock()
-        mock_store.open = MagicMock()
-        mock_store.close = MagicMock()
-        mock_store.create_conversation = MagicMock(return_value="conv-123")
-        mock_store.add_message = MagicMock()
-        mock_store.record_cost = MagicMock()
-
-        brain._router = mock_router
-        brain.context_builder = mock_ctx
         brain._skill_registry = SkillRegistry()
+        monkeypatch.setattr("src.agent.brain.MemoryStore", lambda *a, **kw: mock_store)
 
-        with patch("src.agent.brain.MemoryStore", return_value=mock_store):
-            result = await brain.process_message(
-                message="Hello",
-                channel="test",
-            )
+        result = await brain.process_message(
+            message="Hello",
+            channel="test",
+        )
 
         assert result["response"] == "Hello! How can I help you?"
         assert result["conversation_id"] == "conv-123"
@@ -240,142 +287,76 @@ class TestBrainIntegration:
         assert result["tools_used"] == []
 
     @pytest.mark.asyncio
-    async def test_brain_tool_calling_loop(self, config):
+    async def test_brain_tool_calling_loop(self, config, fake_router, make_store, monkeypatch):
         """Brain should execute tool calls and feed results back to the LLM."""
         brain = AgentBrain(config=config, api_key="test-key")
 
         # First call: LLM requests a tool call
         # Second call: LLM responds with text after seeing tool result
-        call_count = 0
-
-        async def mock_chat(messages, tools=None):
-            nonlocal call_count
-            call_count += 1
+        router = fake_router([_TOOL_CALL_RESP, _FINAL_RESP])
 
-            if call_count == 1:
-                return {
-                    "content": "",
-                    "tool_calls": [
-                        {
-                            "id": "call_1",
-                            "function": {
-                                "name": "test_echo",
-                                "arguments": json.dumps({"text": "hello from tool"}),
-                            },
-                        }
-                    ],
-                    "input_tokens": 15,
-                    "output_tokens": 10,
-                    "cost_usd": 0.0005,
-                    "provider": "test",
-                    "model": "test-model",
-                }
-            else:
-                return {
-                    "content": "I used the echo tool and it said: Echo: hello from tool",
-                    "tool_calls": None,
-                    "input_tokens": 25,
-                    "output_tokens": 30,
-                    "cost_usd": 0.001,
-                    "provider": "test",
-                    "model": "test-model",
-                }
+        mock_store = make_store("conv-456")
 
-        mock_router = MagicMock()
-        mock_router.chat = AsyncMock(side_effect=mock_chat)
-        mock_router.check_budget = MagicMock(return_value=True)
+        # Set up skill registry with the mock skill
+        registry = SkillRegistry()
+        registry.register(MockSkill())
 
-        mock_ctx = MagicMock()
-        mock_ctx.build_messages = MagicMock(
-            return_value=[
+        brain._router = router
+        brain.context_builder = _StubContext(
+            [
                 {"role": "system", "content": "You are a helpful assistant."},
                 {"role": "user", "content": "Echo hello"},
             ]
         )
-
-        mock_store = MagicMock()
-        mock_store.open = MagicMock()
-        mock_store.close = MagicMock()
-        mock_store.create_conversation = MagicMock(return_value="conv-456")
-        mock_store.add_message = MagicMock()
-        mock_store.record_cost = MagicMock()
-
-        # Set up skill registry with the mock skill
-        registry = SkillRegistry()
-        registry.register(MockSkill())
-
-        brain._router = mock_router
-        brain.context_builder = mock_ctx
         brain._skill_registry = registry
         brain._tool_executor = ToolExecutor(
             registry=registry,
             policy_engine=PolicyEngine(autonomy_level=4),
-            audit_logger=AuditLogger(),
-            canary_system=CanarySystem(),
-            egress_filter=EgressFilter(),
+            audit_logger=NullAudit(),
+            canary_system=NullCanary(),
+            egress_filter=NullEgress(),
         )
+        monkeypatch.setattr("src.agent.brain.MemoryStore", lambda *a, **kw: mock_store)
 
-        with patch("src.agent.brain.MemoryStore", return_value=mock_store):
-            result = await brain.process_message(
-                message="Echo hello",
-                channel="test",
-            )
+        result = await brain.process_message(
+            message="Echo hello",
+            channel="test",
+        )
 
         assert "Echo: hello from tool" in result["response"]
         assert "test_echo" in result["tools_used"]
         assert result["tokens_used"] == 80  # 15+10+25+30
-        assert call_count == 2  # Two LLM round-trips
+        assert router.calls == 2  # Two LLM round-trips
 
     @pytest.mark.asyncio
-    async def test_brain_budget_exceeded(self, config):
+    async def test_brain_budget_exceeded(self, config, fake_router, make_store, monkeypatch):
         """Brain should return budget exceeded message when over limit."""
         brain = AgentBrain(config=config, api_key="test-key")
 
-        mock_router = MagicMock()
-        mock_router.check_budget = MagicMock(return_value=False)
-
-        mock_ctx = MagicMock()
-        mock_ctx.build_messages = MagicMock(return_value=[])
-
-        mock_store = MagicMock()
-        mock_store.open = MagicMock()
-        mock_store.close = MagicMock()
-        mock_store.create_conversation = MagicMock(return_value="conv-789")
-        mock_store.add_message = MagicMock()
+        mock_store = make_store("conv-789")
 
-        brain._router = mock_router
-        brain.context_builder = mock_ctx
+        brain._router = fake_router(budget_ok=False)
+        brain.context_builder = _StubContext([])
+        monkeypatch.setattr("src.agent.brain.MemoryStore", lambda *a, **kw: mock_store)
 
-        with patch("src.agent.brain.MemoryStore", return_value=mock_store):
-            result = await brain.process_message(message="Hello", channel="test")
+        result = await brain.process_message(message="Hello", channel="test")
 
         assert "budget" in result["response"].lower()
         assert result["tokens_used"] == 0
 
     @pytest.mark.asyncio
-    async def test_brain_error_handling(self, config):
+    async def test_brain_error_handling(self, config, fake_router, make_store, monkeypatch):
         """Brain should gracefully handle errors."""
         brain = AgentBrain(config=config, api_key="test-key")
 
-        mock_router = MagicMock()
-        mock_router.check_budget = MagicMock(return_value=True)
-        mock_router.chat = AsyncMock(side_effect=Exception("LLM connection failed"))
+        mock_store = make_store("conv-err")
 
-        mock_ctx = MagicMock()
-        mock_ctx.build_messages = MagicMock(return_value=[{"role": "user", "content": "test"}])
-
-        mock_store = MagicMock()
-        mock_store.open = MagicMock()
-        mock_store.close = MagicMock()
-        mock_store.create_conversation = MagicMock(return_value="conv-err")
-        mock_store.add_message = MagicMock()
-
-        brain._router = mock_router
-        brain.context_builder = mock_ctx
+        brain._router = fake_router([Exception("LLM connection failed")])
+        brain.context_builder = _StubContext([{"role": "user", "content": "test"}])
         brain._skill_registry = SkillRegistry()
+        monkeypatch.setattr("src.agent.brain.MemoryStore", lambda *a, **kw: mock_store)
 
-        with patch("src.agent.brain.MemoryStore", return_value=mock_store):
-            result = await brain.process_message(message="Hello", channel="test")
+        result = await brain.process_message(message="Hello", channel="test")
 
         assert "Error" in result["response"]
         assert "LLM connection failed" in result["response"]
@@ -387,49 +368,55 @@ class TestBrainIntegration:
 class TestRegistryIntegration:
     """Test skill registry loading and lookup."""
 
-    def test_load_builtins(self):
+    def test_load_builtins(self, loaded_registry):
         """Built-in skills should load without errors."""
-        registry = SkillRegistry()
-        registry.load_builtins()
-
         # At minimum, the 4 core skills should always load
-        assert registry.count >= 4
+        assert loaded_registry.count >= 4
 
         # Core skills should always be present
-        assert registry.get("file_manager") is not None
-        assert registry.get("shell_exec") is not None
-        assert registry.get("web_search") is not None
-        assert registry.get("notes") is not None
+        assert loaded_registry.get("file_manager") is not None
+        assert loaded_registry.get("shell_exec") is not None
+        assert loaded_registry.get("web_search") is not None
+        assert loaded_registry.get("notes") is not None
 
-    def test_tool_definitions_format(self):
+    def test_tool_definitions_format(self, loaded_registry):
         """All tool definitions should follow the OpenAI function calling format."""
-        registry = SkillRegistry()
-        registry.load_builtins()
-
-        definitions = registry.get_tool_definitions()
+        definitions = loaded_registry.get_tool_definitions()
         assert len(definitions) >= 4
 
         for tool_def in definitions:
-            assert "type" in tool_def
-            assert tool_def["type"] == "function"
-            assert "function" in tool_def
-            func = tool_def["function"]
-            assert "name" in func
-            assert "description" in func
-            assert "parameters" in func
-            assert func["parameters"]["type"] == "object"
-
-    def test_skill_metadata(self):
-        """All skills should have valid metadata."""
-        registry = SkillRegistry()
-        registry.load_builtins()
+            _TOOL_DEF_VALIDATOR.validate(tool_def)
 
-        for meta in registry.list_skills():
+    def test_skill_metadata(self, loaded_registry):
+        """All skills should have valid metadata."""
+        for meta in loaded_registry.list_skills():
             assert meta.name, "Skill must have a name"
             assert meta.description, "Skill must have a description"
             assert meta.version, "Skill must have a version"
             assert meta.author, "Skill must have an author"
 
+    def test_tool_definitions_cached_until_register(self):
+        """Tool definitions are built once and refreshed when a skill is added."""
+        registry = SkillRegistry()
+        skill = MockSkill()
+        registry.register(skill)
+
+        with patch.object(skill, "get_tool_definition", wraps=skill.get_tool_definition) as spy:
+            first = registry.get_tool_definitions()
+            registry.get_tool_definitions()
+            assert spy.call_count == 1
+
+        first.clear()  # Callers get their own list
+        assert len(registry.get_tool_definitions()) == 1
+
+        other = MockSkill()
+        other.get_metadata = lambda: SkillMetadata(
+            name="other", description="Other", version="1.0.0", author="test"
+        )
+        registry.register(other)
+        assert len(registry.get_tool_definitions()) == 2
+        assert [m.name for m in registry.list_skills()] == ["test_echo", "other"]
+
     def test_duplicate_registration_ignored(self):
         """Registering the same skill twice should be silently ignored."""
         registry = SkillRegistry()
@@ -451,9 +438,9 @@ class TestSecurityPipeline:
     """Test the security pipeline components working together."""
 
     @pytest.mark.asyncio
-    async def test_canary_token_injection(self, tool_executor):
+    async def test_canary_token_injection(self, secure_tool_executor):
         """Output from tools should contain canary tokens."""
-        result = await tool_executor.execute_tool_call(
+        result = await secure_tool_executor.execute_tool_call(
             tool_name="test_echo",
             arguments={"text": "sensitive data"},
             channel="test",
@@ -464,7 +451,7 @@ class TestSecurityPipeline:
         assert result["output"]  # Output should not be empty
 
     @pytest.mark.asyncio
-    async def test_egress_filter_redacts_secrets(self):
+    async def test_egress_filter_redacts_secrets(self, audit_dir):
         """Egress filter should redact sensitive data from tool output."""
 
         class LeakySkill(BaseSkill):
@@ -494,7 +481,7 @@ class TestSecurityPipeline:
         executor = ToolExecutor(
             registry=registry,
             policy_engine=PolicyEngine(autonomy_level=4),
-            audit_logger=AuditLogger(),
+            audit_logger=AuditLogger(audit_dir=audit_dir),
             canary_system=CanarySystem(),
             egress_filter=EgressFilter(),
         )
@@ -518,44 +505,23 @@ class TestStreamingIntegration:
     """Test the streaming response pipeline."""
 
     @pytest.mark.asyncio
-    async def test_stream_complete_event(self, config):
+    async def test_stream_complete_event(self, config, fake_router, make_store, monkeypatch):
         """Streaming should yield a 'complete' event at the end."""
         brain = AgentBrain(config=config, api_key="test-key")
 
-        mock_router = MagicMock()
-        mock_router.check_budget = MagicMock(return_value=True)
-        mock_router.chat = AsyncMock(
-            return_value={
-                "content": "Streaming response",
-                "tool_calls": None,
-                "input_tokens": 10,
-                "output_tokens": 20,
-                "cost_usd": 0.001,
-                "provider": "test",
-                "model": "test-model",
-            }
-        )
-
-        mock_ctx = MagicMock()
-        mock_ctx.build_messages = MagicMock(return_value=[{"role": "user", "content": "test"}])
-
-        mock_store = MagicMock()
-        mock_store.open = MagicMock()
-        mock_store.close = MagicMock()
-        mock_store.create_conversation = MagicMock(return_value="conv-stream")
-        mock_store.add_message = MagicMock()
-        mock_store.record_cost = MagicMock()
+        mock_store = make_store("conv-stream")
 
-        brain._router = mock_router
-        brain.context_builder = mock_ctx
+        brain._router = fake_router([_STREAM_RESP])
+        brain.context_builder = _StubContext([{"role": "user", "content": "test"}])
         brain._skill_registry = SkillRegistry()
+        monkeypatch.setattr("src.agent.brain.MemoryStore", lambda *a, **kw: mock_store)
 
         events = []
-        with patch("src.agent.brain.MemoryStore", return_value=mock_store):
-            async for event in brain.stream_message(message="test", channel="test"):
-                events.append(event)
+        async for event in brain.stream_message(message="test", channel="test"):
+            events.append(event)
 
         # Should have at least a chunk and a complete event
         assert len(events) >= 1
         assert events[-1]["type"] == "complete"
         assert events[-1]["conversation_id"] == "conv-stream"
+        assert events[-1]["content"] == "Streaming response"
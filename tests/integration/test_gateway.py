@@ -7,50 +7,53 @@ of all REST API endpoints.
 
 from __future__ import annotations
 
-import os
-from unittest.mock import MagicMock, patch
+import functools
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def app():
-    """Create a test FastAPI app with auth bypassed."""
-    os.environ["GULAMA_TEST_MODE"] = "1"
-
-    with patch("src.gateway.app.load_config") as mock_config:
-        config = MagicMock()
-        config.gateway.host = "127.0.0.1"
-        config.gateway.port = 18789
-        config.gateway.websocket_origins = ["http://localhost:3000"]
-        config.logging.level = "WARNING"
-        config.logging.format = "text"
-        config.llm.provider = "test"
-        config.llm.model = "test-model"
-        config.autonomy.default_level = 3
-        config.security.sandbox_enabled = True
-        config.security.policy_engine_enabled = True
-        config.security.canary_tokens_enabled = True
-        config.security.egress_filtering_enabled = True
-        config.security.audit_logging_enabled = True
-        config.auth.session_timeout_seconds = 3600
-        config.cost.daily_budget_usd = 10.0
-
-        mock_config.return_value = config
+@functools.lru_cache(maxsize=4)
+def _build_app(provider: str = "test", model: str = "test-model", autonomy_level: int = 3):
+    """Build a test FastAPI app with auth bypassed, once per distinct config."""
+    config = MagicMock()
+    config.gateway.host = "127.0.0.1"
+    config.gateway.port = 18789
+    config.gateway.websocket_origins = ["http://localhost:3000"]
+    config.logging.level = "WARNING"
+    config.logging.format = "text"
+    config.llm.provider = provider
+    config.llm.model = model
+    config.autonomy.default_level = autonomy_level
+    config.security.sandbox_enabled = True
+    config.security.policy_engine_enabled = True
+    config.security.canary_tokens_enabled = True
+    config.security.egress_filtering_enabled = True
+    config.security.audit_logging_enabled = True
+    config.auth.session_timeout_seconds = 3600
+    config.cost.daily_budget_usd = 10.0
+
+    # create_app() is the only reader of load_config, so patch just the build
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.gateway.app.load_config", lambda: config)
 
         from src.gateway.app import create_app
 
         application = create_app()
-        application.state.config = config
 
-        # Make auth manager accept a test token
-        application.state.auth_manager.verify_session = MagicMock(return_value=True)
+    # Make auth manager accept a test token
+    application.state.auth_manager.verify_session = MagicMock(return_value=True)
+    return application
+
 
-        yield application
+@pytest.fixture(scope="session")
+def app():
+    """Shared test app (read-only in tests)."""
+    return _build_app()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
     """Create a test client with auth token."""
     c = TestClient(app, raise_server_exceptions=False)
@@ -7,6 +7,7 @@ verifying the full skill lifecycle: init → execute → result.
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -203,6 +204,289 @@ class TestWebSearchSkill:
             result = await skill.execute(query="test search")
             assert isinstance(result, SkillResult)
 
+    @pytest.mark.asyncio
+    async def test_search_results_cached(self):
+        """Identical queries should be served from the TTL cache."""
+        skill = WebSearchSkill()
+        skill._ddgs = MagicMock()
+        skill._ddgs.text.return_value = [
+            {"title": "Result", "href": "https://example.com", "body": "Body"}
+        ]
+
+        first = await skill.execute(operation="search", query="gulama")
+        second = await skill.execute(operation="search", query="gulama")
+
+        assert first.success is True
+        assert second.output == first.output
+        assert second.metadata["cached"] is True
+        assert skill._ddgs.text.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_search_and_read_fetches_pages(self):
+        """search_and_read should fetch every result and fall back to snippets."""
+        skill = WebSearchSkill()
+        skill._ddgs = MagicMock()
+        skill._ddgs.text.return_value = [
+            {"title": "A", "href": "https://a.example", "body": "snippet a"},
+            {"title": "B", "href": "https://b.example", "body": "snippet b"},
+        ]
+
+        async def fake_fetch(url):
+            if url == "https://a.example":
+                return SkillResult(success=True, output="full page a")
+            return SkillResult(success=False, output="", error="boom")
+
+        skill._fetch = fake_fetch
+        result = await skill.execute(operation="search_and_read", query="gulama")
+
+        assert result.success is True
+        assert "full page a" in result.output
+        assert "snippet b" in result.output
+        assert result.metadata["pages_read"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_html_is_capped(self):
+        """Large HTML pages should only be read up to MAX_HTML_BYTES."""
+        import httpx
+
+        from src.skills.builtin import web_search
+
+        page = "<html><body><p>Start</p>" + "<p>filler</p>" * 50_000 + "<p>END</p></body></html>"
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "text/html; charset=utf-8"}, content=page.encode()
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(web_search, "get_http_client", return_value=client):
+            result = await WebSearchSkill().execute(operation="fetch", url="https://example.com/")
+        await client.aclose()
+
+        assert len(page) > web_search.MAX_HTML_BYTES
+        assert result.success is True
+        assert result.output.startswith("Start")
+        assert "END" not in result.output
+
+    @pytest.mark.asyncio
+    async def test_fetch_plaintext_is_capped(self):
+        """Non-HTML bodies should be decoded only up to the output limit."""
+        import httpx
+
+        from src.skills.builtin import web_search
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "text/plain"}, content=b"a" * 500_000
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(web_search, "get_http_client", return_value=client):
+            result = await WebSearchSkill().execute(operation="fetch", url="https://example.com/")
+        await client.aclose()
+
+        assert result.success is True
+        assert result.output.startswith("a" * web_search.MAX_OUTPUT_CHARS)
+        assert result.output.endswith("[Truncated — content too long]")
+
+    def test_extract_text_skips_boilerplate(self):
+        """Script/nav content should be dropped from extracted text."""
+        html = (
+            "<html><head><script>var x = 1;</script></head><body>"
+            "<nav>Menu</nav><p>Hello <b>world</b></p><footer>Legal</footer>"
+            "</body></html>"
+        )
+        text = WebSearchSkill._extract_text(html)
+        assert "Hello" in text and "world" in text
+        assert "var x" not in text
+        assert "Menu" not in text
+        assert "Legal" not in text
+
+
+# ── Smart Home Skill ──────────────────────────────────
+
+
+class TestSmartHomeSkill:
+    """Test Home Assistant request handling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_coalesced(self):
+        """Concurrent identical GETs should share a single HA request."""
+        import asyncio
+
+        from src.skills.builtin.smart_home import SmartHomeSkill
+
+        skill = SmartHomeSkill()
+        calls = 0
+
+        async def fake_send(method, path, json_data=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"entity_id": "light.kitchen", "state": "on"}]
+
+        skill._ha_send = fake_send
+        results = await asyncio.gather(*(skill._ha_request("GET", "/states") for _ in range(3)))
+
+        assert calls == 1
+        assert all(r == results[0] for r in results)
+        assert skill._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_shared_get(self):
+        """Cancelling the caller that started a coalesced GET leaves the others served."""
+        import asyncio
+
+        from src.skills.builtin.smart_home import SmartHomeSkill
+
+        skill = SmartHomeSkill()
+        release = asyncio.Event()
+
+        async def fake_send(method, path, json_data=None):
+            await release.wait()
+            return {"state": "on"}
+
+        skill._ha_send = fake_send
+        first = asyncio.create_task(skill._ha_request("GET", "/states/light.kitchen"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(skill._ha_request("GET", "/states/light.kitchen"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == {"state": "on"}
+        assert first.cancelled()
+        assert skill._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_posts_not_coalesced(self):
+        """Non-idempotent requests should each hit the network."""
+        import asyncio
+
+        from src.skills.builtin.smart_home import SmartHomeSkill
+
+        skill = SmartHomeSkill()
+        skill._ha_send = AsyncMock(return_value={})
+        await asyncio.gather(
+            *(skill._ha_request("POST", "/services/light/turn_on", {}) for _ in range(2))
+        )
+
+        assert skill._ha_send.await_count == 2
+
+
+# ── Voice Skill ───────────────────────────────────────
+
+
+class TestVoiceSkill:
+    """Test voice skill helpers that don't need external services."""
+
+    def test_tts_cache_roundtrip(self, tmp_path, monkeypatch):
+        """Stored audio should be served back for the same key."""
+        from src.skills.builtin import voice_skill
+
+        monkeypatch.setattr(voice_skill, "TTS_CACHE_DIR", tmp_path / "tts")
+        skill = voice_skill.VoiceSkill()
+        key = skill._tts_cache_key("openai", "alloy", "tts-1", "hello")
+
+        out = tmp_path / "out.mp3"
+        assert skill._tts_cache_fetch(key, str(out)) is False
+
+        out.write_bytes(b"ID3fake")
+        skill._tts_cache_store(key, str(out))
+
+        again = tmp_path / "again.mp3"
+        assert skill._tts_cache_fetch(key, str(again)) is True
+        assert again.read_bytes() == b"ID3fake"
+        assert key != skill._tts_cache_key("openai", "nova", "tts-1", "hello")
+
+        # An I/O error on the destination is a miss, not a synthesis failure
+        assert skill._tts_cache_fetch(key, str(tmp_path)) is False
+
+    def test_chunk_text_respects_sentence_boundaries(self):
+        """Long text should split into sentence groups within the size limit."""
+        from src.skills.builtin.voice_skill import _chunk_text
+
+        text = "One sentence here. " * 100 + "x" * 250
+        chunks = _chunk_text(text, limit=200)
+
+        assert all(len(c) <= 200 for c in chunks)
+        assert chunks[0].endswith(".")
+        assert "".join(chunks).replace(" ", "") == text.replace(" ", "")
+
+    @pytest.mark.asyncio
+    async def test_long_text_synthesized_in_order(self, tmp_path, monkeypatch):
+        """Chunked synthesis should concatenate audio in input order."""
+        import json
+
+        import httpx
+
+        from src.skills.builtin import voice_skill
+
+        def handler(request):
+            return httpx.Response(200, content=json.loads(request.content)["input"][:3].encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(voice_skill, "get_http_client", lambda: client)
+
+        out = tmp_path / "speech.mp3"
+        requests = [
+            ("https://tts.example", {"json": {"input": chunk}})
+            for chunk in ["AAA.", "BBB.", "CCC."]
+        ]
+        status, size = await voice_skill._post_many_to_file(requests, str(out))
+        await client.aclose()
+
+        assert status == 200
+        assert out.read_bytes() == b"AAABBBCCC"
+        assert size == 9
+        assert [p.name for p in tmp_path.iterdir()] == ["speech.mp3"]  # parts removed
+
+    @pytest.mark.asyncio
+    async def test_chunked_synthesis_error_writes_nothing(self, tmp_path, monkeypatch):
+        """A failed chunk should leave neither the output nor any part files."""
+        import json
+
+        import httpx
+
+        from src.skills.builtin import voice_skill
+
+        def handler(request):
+            text = json.loads(request.content)["input"]
+            return httpx.Response(500 if text == "BBB." else 200, content=text.encode())
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(voice_skill, "get_http_client", lambda: client)
+
+        requests = [
+            ("https://tts.example", {"json": {"input": chunk}})
+            for chunk in ["AAA.", "BBB.", "CCC."]
+        ]
+        status, size = await voice_skill._post_many_to_file(requests, str(tmp_path / "s.mp3"))
+        await client.aclose()
+
+        assert (status, size) == (500, 0)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_tts_cache_eviction(self, tmp_path, monkeypatch):
+        """Eviction should drop the oldest entries first."""
+        import os
+
+        from src.skills.builtin import voice_skill
+
+        cache_dir = tmp_path / "tts"
+        cache_dir.mkdir()
+        monkeypatch.setattr(voice_skill, "TTS_CACHE_DIR", cache_dir)
+        for i in range(3):
+            f = cache_dir / f"{i}.mp3"
+            f.write_bytes(b"x" * 100)
+            os.utime(f, (i, i))
+
+        voice_skill.VoiceSkill._tts_cache_evict(max_bytes=150)
+
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["2.mp3"]
+
 
 # ── Optional Skills Import Test ───────────────────────
 
@@ -306,6 +590,110 @@ class TestMarketplaceIntegration:
         assert len(priv) > 0
         assert len(pub) > 0
 
+    def test_install_verifies_and_records_hash(self, tmp_dir, monkeypatch):
+        """Signed skills install with their SHA-256 recorded; bad signatures are rejected."""
+        import hashlib
+        import json
+
+        from src.skills.marketplace import GulamaHub
+
+        monkeypatch.setattr(GulamaHub, "INSTALLED_DIR", tmp_dir / "community")
+        hub = GulamaHub()
+        source = tmp_dir / "hello.py"
+        source.write_bytes(b"print('hello')\n")
+        priv, pub = GulamaHub.generate_keypair()
+        sig = GulamaHub.sign_file(source, priv)
+
+        assert hub.install("hello", source, sig, pub) is True
+        manifest = json.loads((tmp_dir / "community" / "hello" / "manifest.json").read_text())
+        assert manifest["sha256"] == hashlib.sha256(source.read_bytes()).hexdigest()
+        assert (tmp_dir / "community" / "hello" / "skill.py").read_bytes() == source.read_bytes()
+
+        _, other_pub = GulamaHub.generate_keypair()
+        assert hub.install("evil", source, sig, other_pub) is False
+        assert not (tmp_dir / "community" / "evil").exists()
+
+    def test_install_many_verifies_each_package(self, tmp_dir, monkeypatch):
+        """Bulk install should reject only the packages whose signatures fail."""
+        from src.skills.marketplace import GulamaHub
+
+        monkeypatch.setattr(GulamaHub, "INSTALLED_DIR", tmp_dir / "community")
+        hub = GulamaHub()
+        priv, pub = GulamaHub.generate_keypair()
+        specs = []
+        for i in range(4):
+            source = tmp_dir / f"skill{i}.py"
+            source.write_bytes(f"VALUE = {i}\n".encode())
+            specs.append((f"skill{i}", source, GulamaHub.sign_file(source, priv), pub))
+        specs[2] = (specs[2][0], specs[2][1], specs[0][2], pub)  # Signature for other bytes
+
+        assert hub.verify_batch([spec[1:] for spec in specs]) == [True, True, False, True]
+        assert hub.install_many(specs) == [True, True, False, True]
+        assert sorted(s["name"] for s in hub.list_installed()) == ["skill0", "skill1", "skill3"]
+
+        manifest_file = tmp_dir / "community" / "skill0" / "manifest.json"
+        manifest_file.write_bytes(b'{"name": "renamed", "version": "2.0.0"}')
+        os.utime(manifest_file, ns=(0, manifest_file.stat().st_mtime_ns + 1_000_000))
+        assert "renamed" in {s["name"] for s in hub.list_installed()}
+
+    def test_registry_shared_across_instances(self, tmp_dir, monkeypatch):
+        """A second hub reuses the parsed registry and still sees new publishes."""
+        from src.skills import marketplace
+        from src.skills.marketplace import GulamaHub, SkillPackage
+
+        monkeypatch.setattr(GulamaHub, "INSTALLED_DIR", tmp_dir / "community")
+        monkeypatch.setattr(GulamaHub, "REGISTRY_FILE", tmp_dir / "hub_registry.json")
+        pkg = SkillPackage(
+            name="weather",
+            version="1.0.0",
+            author="a",
+            description="Forecasts",
+            signature="00",
+            public_key="00",
+        )
+        assert GulamaHub().publish(pkg) is True
+
+        with patch.object(marketplace.orjson, "loads", side_effect=AssertionError("re-parsed")):
+            assert [p.name for p in GulamaHub().search("weather")] == ["weather"]
+
+        other = SkillPackage(
+            name="news",
+            version="1.0.0",
+            author="a",
+            description="Headlines",
+            signature="00",
+            public_key="00",
+        )
+        GulamaHub().publish(other)
+        assert {p.name for p in GulamaHub().search()} == {"weather", "news"}
+        assert GulamaHub().get("news").description == "Headlines"
+        assert GulamaHub().get("missing") is None
+
+    def test_search_is_case_insensitive(self, tmp_dir, monkeypatch):
+        """Search should match name, description and tags regardless of case."""
+        from src.skills.marketplace import GulamaHub, SkillPackage
+
+        monkeypatch.setattr(GulamaHub, "INSTALLED_DIR", tmp_dir / "community")
+        monkeypatch.setattr(GulamaHub, "REGISTRY_FILE", tmp_dir / "hub_registry.json")
+        hub = GulamaHub()
+        hub.publish(
+            SkillPackage(
+                name="WeatherBot",
+                version="1.0.0",
+                author="a",
+                description="Daily FORECASTS",
+                signature="00",
+                public_key="00",
+                tags=["Weather", "API"],
+            )
+        )
+
+        assert [p.name for p in hub.search("weatherbot")] == ["WeatherBot"]
+        assert [p.name for p in hub.search("forecasts")] == ["WeatherBot"]
+        assert [p.name for p in hub.search(tag="api")] == ["WeatherBot"]
+        assert [p.name for p in GulamaHub().search(tag="WEATHER")] == ["WeatherBot"]
+        assert hub.search(tag="news") == []
+
 
 # ── Self-Modifier Integration ─────────────────────────
 
@@ -355,3 +743,133 @@ class MaliciousSkill:
             or "violation" in result.error.lower()
             or "subprocess" in result.error.lower()
         )
+
+    def test_security_scan_flags_secret_material(self):
+        """String-literal secret access should be caught after the AST pass."""
+        from src.skills.self_modifier import SelfModifierSkill
+
+        scan = SelfModifierSkill()._security_scan
+        assert scan('path = "~/.ssh/id_rsa"') == "SSH key access not allowed"
+        assert scan('pem = "-----BEGIN EC KEY-----"') == "Private key access not allowed"
+        assert scan('x = "hello"') is None
+
+    def test_security_scan_and_validation_share_ast(self):
+        """Checks are AST based: comments are ignored, indirect builtins are not."""
+        from src.skills.self_modifier import SelfModifierSkill, _analyze_code
+
+        skill = SelfModifierSkill()
+        assert skill._security_scan("# eval(x) would be bad\nx = 1\n") is None
+        assert skill._security_scan('f = getattr(__builtins__, "ev" + "al")') == (
+            "__builtins__ access not allowed"
+        )
+        assert skill._security_scan("import builtins") == "Import of 'builtins' not allowed"
+
+        code = (
+            "class Demo(BaseSkill):\n"
+            "    def get_metadata(self): ...\n"
+            "    def get_tool_definition(self): ...\n"
+            "    def execute(self): ...\n"
+        )
+        _analyze_code.cache_clear()
+        assert skill._validate_skill_code(code) == {
+            "valid": False,
+            "error": "Missing: async def execute",
+        }
+        skill._security_scan(code)
+        assert _analyze_code.cache_info().misses == 1
+
+    @pytest.mark.asyncio
+    async def test_create_then_update_backs_up(self, tmp_dir, monkeypatch):
+        """Create/update validate off the loop and keep the previous version as .bak."""
+        from src.skills import self_modifier
+
+        monkeypatch.setattr(self_modifier, "AUTHORED_DIR", tmp_dir)
+        code = (
+            "class Echo(BaseSkill):\n"
+            "    def get_metadata(self): ...\n"
+            "    def get_tool_definition(self): ...\n"
+            "    async def execute(self, **kwargs): ...\n"
+        )
+        skill = self_modifier.SelfModifierSkill()
+
+        created = await skill.execute(action="create", skill_name="echo", code=code)
+        updated = await skill.execute(action="update", skill_name="echo", code=code + "# v2\n")
+
+        assert created.success and updated.success
+        assert (tmp_dir / "echo.py.bak").read_text().endswith(code)
+        assert (tmp_dir / "echo.py").read_text().endswith("# v2\n")
+
+    @pytest.mark.asyncio
+    async def test_authored_bytecode_cached_and_deleted(self, tmp_dir, monkeypatch):
+        """Loading an authored skill writes __pycache__ bytecode; delete removes it."""
+        import importlib.util
+        import sys
+
+        from src.skills import self_modifier
+
+        monkeypatch.setattr(self_modifier, "AUTHORED_DIR", tmp_dir)
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        skill_file = tmp_dir / "cached_skill.py"
+        skill_file.write_text(
+            "from src.skills.base import BaseSkill\n\nclass CachedSkill(BaseSkill):\n    pass\n"
+        )
+        pyc = Path(importlib.util.cache_from_source(str(skill_file)))
+
+        assert self_modifier._load_skill_class("cached_skill", skill_file) is not None
+        assert pyc.exists()
+
+        result = await self_modifier.SelfModifierSkill().execute(
+            action="delete", skill_name="cached_skill"
+        )
+        assert result.success is True
+        assert not pyc.exists()
+
+    @pytest.mark.asyncio
+    async def test_authored_skill_class_discovery(self, tmp_dir, monkeypatch):
+        """Authored skills are found via BaseSkill subclasses and reused while unchanged."""
+        from src.skills import self_modifier
+
+        monkeypatch.setattr(self_modifier, "AUTHORED_DIR", tmp_dir)
+        (tmp_dir / "greeter.py").write_text(
+            "from src.skills.base import BaseSkill, SkillMetadata, SkillResult\n"
+            "from src.skills.builtin.notes import NotesSkill  # imported, not defined here\n"
+            "\n"
+            "class GreeterSkill(BaseSkill):\n"
+            "    def get_metadata(self):\n"
+            "        return SkillMetadata(name='greeter', description='hi', version='1.0')\n"
+            "    def get_tool_definition(self):\n"
+            "        return {'function': {'name': 'greeter'}}\n"
+            "    async def execute(self, **kwargs):\n"
+            "        return SkillResult(success=True, output='hi')\n"
+        )
+
+        skill = self_modifier.SelfModifierSkill()
+        loaded = skill.load_authored_skills()
+        assert [type(s).__name__ for s in loaded] == ["GreeterSkill"]
+
+        result = await skill.execute(action="test", skill_name="greeter")
+        assert result.success is True
+        assert type(skill.load_authored_skills()[0]) is type(loaded[0])
+
+    def test_authored_skill_indirect_subclass(self, tmp_dir, monkeypatch):
+        """A skill deriving from an intermediate base in the same file is found."""
+        from src.skills import self_modifier
+
+        monkeypatch.setattr(self_modifier, "AUTHORED_DIR", tmp_dir)
+        (tmp_dir / "layered.py").write_text(
+            "from src.skills.base import BaseSkill, SkillMetadata, SkillResult\n"
+            "\n"
+            "class Base(BaseSkill):\n"
+            "    def get_tool_definition(self):\n"
+            "        return {'function': {'name': 'layered'}}\n"
+            "    async def execute(self, **kwargs):\n"
+            "        return SkillResult(success=True, output='ok')\n"
+            "\n"
+            "class LayeredSkill(Base):\n"
+            "    def get_metadata(self):\n"
+            "        return SkillMetadata(name='layered', description='x', version='1.0')\n"
+        )
+
+        loaded = self_modifier.SelfModifierSkill().load_authored_skills()
+
+        assert [type(s).__name__ for s in loaded] == ["LayeredSkill"]
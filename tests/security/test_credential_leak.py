@@ -8,6 +8,7 @@ detect and block credential exfiltration attempts.
 from __future__ import annotations
 
 from src.security.egress_filter import EgressFilter
+from src.utils.logging import _add_info_and_redact, _redact_secrets, _redact_string
 
 
 class TestCredentialLeakPrevention:
@@ -73,3 +74,53 @@ class TestCredentialLeakPrevention:
             body="data contains canary_secret_abc value",
         )
         assert not result.allowed
+
+
+class TestLogRedaction:
+    """Verify secrets never reach log output."""
+
+    def test_secrets_redacted(self):
+        text = "key sk-ant-REDACTED and AKIA1234567890ABCDEF"
+        assert _redact_string(text) == "key [REDACTED] and [REDACTED]"
+
+    def test_clean_text_unchanged(self):
+        text = "scan_complete skill=demo passed=True"
+        assert _redact_string(text) is text
+
+    def test_nested_fields_redacted(self):
+        event = _redact_secrets(None, None, {"event": "x", "ctx": {"token": "ghp_" + "a" * 36}})
+        assert event["ctx"]["token"] == "[REDACTED]"
+
+    def test_fused_processor_matches_separate_ones(self):
+        event = {"event": "call", "key": "AKIA1234567890ABCDEF", "ctx": {"n": 1, "e": "a@b.io"}}
+
+        fused = _add_info_and_redact(None, None, dict(event))
+
+        assert fused == {**_redact_secrets(None, None, dict(event)), "service": "gulama"}
+        assert fused["key"] == "[REDACTED]"
+
+    def test_joined_redaction_keeps_fields_aligned(self):
+        key = "sk-" + "a" * 24
+        event = {
+            "a": "-----BEGIN",
+            "b": "x PRIVATE KEY-----",
+            "nested": {"email": "bob@example.com", "n": 1},
+            "sep": "x\x1ey",
+            "plain": "ok",
+            "k": key,
+        }
+
+        _redact_secrets(None, None, event)
+
+        assert event["nested"] == {"email": "[REDACTED]", "n": 1}
+        assert event["sep"] == "x\x1ey"
+        assert event["plain"] == "ok"
+        assert event["k"] == "[REDACTED]"
+        assert (event["a"], event["b"]) == ("-----BEGIN", "x PRIVATE KEY-----")
+
+    def test_match_across_fields_falls_back_per_field(self):
+        event = {"a": "-----BEGIN", "b": "x PRIVATE KEY-----", "c": "AKIA1234567890ABCDEF"}
+
+        _redact_secrets(None, None, event)
+
+        assert event == {"a": "-----BEGIN", "b": "x PRIVATE KEY-----", "c": "[REDACTED]"}
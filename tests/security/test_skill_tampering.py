@@ -83,6 +83,45 @@ class TestSkillTamperingPrevention:
 
             assert output.exists()
             assert len(sha256) == 64  # SHA-256 hex length
+            assert sha256 == hashlib.sha256(output.read_bytes()).hexdigest()
+
+    def test_package_skill_skips_hidden_and_cache_files(self):
+        """Packages exclude dotfiles and __pycache__, even under a dot-directory."""
+        import tarfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            skill_dir = Path(tmpdir) / ".gulama" / "skills" / "test_skill"
+            (skill_dir / "__pycache__").mkdir(parents=True)
+            (skill_dir / ".git").mkdir()
+            (skill_dir / "pkg").mkdir()
+            (skill_dir / "main.py").write_text("def run(): pass\n")
+            (skill_dir / "pkg" / "util.py").write_text("X = 1\n")
+            (skill_dir / ".env").write_text("SECRET=1\n")
+            (skill_dir / ".git" / "config").write_text("[core]\n")
+            (skill_dir / "__pycache__" / "main.cpython-312.pyc").write_bytes(b"\0")
+
+            output = Path(tmpdir) / "test_skill.tar.gz"
+            self.signer.package_skill(skill_dir, output)
+
+            with tarfile.open(output) as tar:
+                names = sorted(tar.getnames())
+            assert names == ["test_skill/main.py", "test_skill/pkg/util.py"]
+
+    def test_package_skill_is_reproducible(self):
+        """The same tree hashes identically regardless of mtimes or creation order."""
+        import os
+
+        hashes = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i, names in enumerate((["b.py", "a.py"], ["a.py", "b.py"])):
+                skill_dir = Path(tmpdir) / str(i) / "test_skill"
+                skill_dir.mkdir(parents=True)
+                for name in names:
+                    (skill_dir / name).write_text(f"# {name}\n")
+                    os.utime(skill_dir / name, (1000 + i, 1000 + i))
+                hashes.append(self.signer.package_skill(skill_dir, Path(tmpdir) / f"{i}.tar.gz"))
+
+        assert hashes[0] == hashes[1]
 
     def test_builtin_skill_verification(self):
         """Built-in skills should be auto-trusted."""
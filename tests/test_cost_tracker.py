@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
 from src.utils.cost_tracker import CostTracker
@@ -25,6 +27,9 @@ class TestCostTracker:
         assert entry.input_tokens == 1000
         assert entry.output_tokens == 500
         assert entry.provider == "anthropic"
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.cost_usd = 0.0
 
     def test_cost_estimation(self):
         """Cost estimation should return a non-negative value."""
@@ -36,6 +41,23 @@ class TestCostTracker:
         )
         assert cost >= 0.0
 
+    def test_iso_timestamp_reused_within_second(self, monkeypatch):
+        from src.utils import cost_tracker
+
+        monkeypatch.setattr(cost_tracker.time, "time", lambda: 1_700_000_000.25)
+        first = cost_tracker._iso_now()
+        monkeypatch.setattr(cost_tracker.time, "time", lambda: 1_700_000_000.75)
+
+        assert cost_tracker._iso_now() is first
+        assert first == "2023-11-14T22:13:20+00:00"
+
+    def test_cost_estimation_lookup_order(self):
+        """Exact prices win, wildcard providers match any model, others use the default."""
+        estimate = self.tracker.estimate_cost
+        assert estimate("openai", "gpt-4o", 1000, 0) == pytest.approx(0.0025)
+        assert estimate("ollama", "llama3.2/latest", 1000, 1000) == 0.0
+        assert estimate("unknown", "model", 1000, 0) == pytest.approx(0.002)
+
     @pytest.mark.asyncio
     async def test_session_stats_accumulate(self):
         """Multiple records should accumulate session totals."""
@@ -50,6 +72,17 @@ class TestCostTracker:
         assert session["session_tokens"] == 750  # 5 * (100 + 50)
         assert session["session_cost_usd"] >= 0
 
+    @pytest.mark.asyncio
+    async def test_session_stats_buffer_reused(self):
+        """Session stats are refreshed in place; dashboards keep a snapshot."""
+        first = self.tracker.get_session_stats()
+        dashboard = self.tracker.get_dashboard_data()
+        await self.tracker.record("openai", "gpt-4o", 10, 10)
+
+        assert self.tracker.get_session_stats() is first
+        assert first["session_tokens"] == 20
+        assert dashboard["session"]["session_tokens"] == 0
+
     def test_today_stats_without_store(self):
         """Without memory store, today stats should return defaults."""
         stats = self.tracker.get_today_stats()
@@ -75,3 +108,134 @@ class TestCostTracker:
         )
         session = self.tracker.get_session_stats()
         assert session["session_cost_usd"] > 0
+
+
+class TestCostPersistence:
+    """Cost entries are buffered and written to the store in batches."""
+
+    @pytest.fixture
+    def store(self, db_path):
+        from src.memory.store import MemoryStore
+
+        store = MemoryStore(db_path=db_path)
+        store.open()
+        yield store
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_entries_batched_until_flush(self, store, monkeypatch):
+        from src.utils import cost_tracker
+
+        monkeypatch.setattr(cost_tracker, "COST_FLUSH_BATCH", 3)
+        tracker = CostTracker(memory_store=store, daily_budget_usd=1.0)
+
+        for _ in range(2):
+            await tracker.record("openai", "gpt-4o", 100, 50, cost_usd=0.25)
+        assert store.get_stats()["cost_tracking"] == 0
+        assert tracker.get_today_stats()["today_cost_usd"] == 0.5
+
+        await tracker.record("openai", "gpt-4o", 100, 50, cost_usd=0.25)
+        assert store.get_stats()["cost_tracking"] == 3
+
+        await tracker.record("openai", "gpt-4o", 100, 50, cost_usd=0.25)
+        assert tracker.is_budget_exceeded() is True
+        tracker.flush()
+        assert store.get_today_cost() == 1.0
+
+    @pytest.mark.asyncio
+    async def test_pending_entries_persisted_on_shutdown(self, store):
+        from src.utils import cost_tracker
+
+        tracker = CostTracker(memory_store=store)
+        await tracker.record("openai", "gpt-4o", 100, 50, cost_usd=0.25)
+        assert store.get_stats()["cost_tracking"] == 0
+
+        cost_tracker.flush_cost_trackers()
+        assert store.get_stats()["cost_tracking"] == 1
+
+        await tracker.record("openai", "gpt-4o", 100, 50, cost_usd=0.25)
+        cost_tracker._flush_at_exit()
+        assert store.get_today_cost() == 0.5
+
+    @pytest.mark.asyncio
+    async def test_idle_entry_flushed_after_interval(self, store, monkeypatch):
+        import asyncio
+
+        from src.utils import cost_tracker
+
+        tracker = CostTracker(memory_store=store)
+        monkeypatch.setattr(cost_tracker, "COST_FLUSH_INTERVAL", 0.05)
+        await tracker.record("openai", "gpt-4o", 100, 50, cost_usd=0.25)
+        assert store.get_stats()["cost_tracking"] == 0
+
+        await asyncio.sleep(0.2)
+        assert store.get_stats()["cost_tracking"] == 1
+
+    @pytest.mark.asyncio
+    async def test_history_includes_pending(self, store):
+        tracker = CostTracker(memory_store=store)
+        await tracker.record("anthropic", "claude-haiku-4-5-20251001", 10, 10, cost_usd=0.01)
+
+        history = tracker.get_history(days=1)
+
+        assert [row["total_cost"] for row in history] == [0.01]
+
+    @pytest.mark.asyncio
+    async def test_store_reread_only_near_budget(self):
+        from unittest.mock import MagicMock
+
+        store = MagicMock()
+        store.get_today_cost.return_value = 0.0
+        tracker = CostTracker(memory_store=store, daily_budget_usd=1.0)
+
+        for _ in range(3):
+            await tracker.record("openai", "gpt-4o", 10, 10, cost_usd=0.2)
+        assert store.get_today_cost.call_count == 1  # loaded once for the day
+
+        store.get_today_cost.return_value = 1.5  # includes another session's spend
+        await tracker.record("openai", "gpt-4o", 10, 10, cost_usd=0.2)
+
+        assert store.record_costs.call_count == 1
+        assert tracker.is_budget_exceeded() is True
+
+    @pytest.mark.asyncio
+    async def test_today_total_resets_at_midnight(self):
+        from unittest.mock import MagicMock
+
+        store = MagicMock()
+        store.get_today_cost.return_value = 0.3
+        tracker = CostTracker(memory_store=store, daily_budget_usd=1.0)
+        await tracker.record("openai", "gpt-4o", 10, 10, cost_usd=0.1)
+        tracker._today_ends_at = 0.0  # as if UTC midnight has just passed
+
+        store.get_today_cost.return_value = 0.0
+        assert tracker.get_today_stats()["today_cost_usd"] == 0.0
+        assert tracker._today_ends_at - time.time() <= 86400
+
+    def test_dashboard_weekly_slice(self, store):
+        from datetime import UTC, datetime, timedelta
+
+        now = datetime.now(UTC)
+        store.record_costs(
+            [
+                {
+                    "provider": "openai",
+                    "model": "gpt-4o",
+                    "input_tokens": 1,
+                    "output_tokens": 1,
+                    "cost_usd": cost,
+                    "timestamp": (now - timedelta(days=age)).isoformat(),
+                }
+                for cost, age in ((1.0, 0), (2.0, 3), (4.0, 20))
+            ]
+        )
+        tracker = CostTracker(memory_store=store)
+        calls = []
+        real = store.get_cost_summary
+        store.get_cost_summary = lambda days: calls.append(days) or real(days)
+
+        dashboard = tracker.get_dashboard_data()
+
+        assert calls == [30]
+        assert dashboard["weekly_cost_usd"] == 3.0
+        assert dashboard["monthly_cost_usd"] == 7.0
@@ -0,0 +1,64 @@
+"""Tests for the shared HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.utils.http_client import close_http_client, get_http_client
+
+
+class TestSharedHttpClient:
+    """Tests for get_http_client / close_http_client."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_within_loop(self):
+        """Repeated calls on the same loop should return the same client."""
+        client = get_http_client()
+        assert get_http_client() is client
+        await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_close_resets_client(self):
+        """Closing should make the next call build a fresh client."""
+        client = get_http_client()
+        await close_http_client()
+        assert client.is_closed
+        new_client = get_http_client()
+        assert new_client is not client
+        await close_http_client()
+
+    def test_new_client_per_event_loop(self):
+        """A client must not be shared across event loops."""
+
+        async def grab():
+            return get_http_client()
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+        assert first is not second
+
+    def test_close_only_affects_current_loop(self):
+        """Each loop's owner closes its own client; other loops keep theirs."""
+
+        async def grab():
+            return get_http_client()
+
+        async def grab_and_close():
+            client = get_http_client()
+            await close_http_client()
+            return client
+
+        closed = asyncio.run(grab_and_close())
+        assert closed.is_closed
+
+        loop = asyncio.new_event_loop()
+        try:
+            kept = loop.run_until_complete(grab())
+            asyncio.run(grab_and_close())
+            assert not kept.is_closed
+            loop.run_until_complete(close_http_client())
+            assert kept.is_closed
+        finally:
+            loop.close()
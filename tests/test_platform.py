@@ -0,0 +1,27 @@
+"""Tests for platform detection utilities."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+from src.utils import platform
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+def test_best_sandbox_uses_first_available_tool(tmp_dir, monkeypatch):
+    for name in ("docker", "runsc"):
+        (tmp_dir / name).write_text("#!/bin/sh\n")
+    (tmp_dir / "docker").chmod(0o755)  # runsc present but not executable
+    monkeypatch.setenv("PATH", os.pathsep.join([str(tmp_dir), str(tmp_dir / "missing")]))
+    monkeypatch.setattr(platform, "detect_os", lambda: platform.OSType.LINUX)
+    platform.has_tool.cache_clear()
+    platform.detect_best_sandbox.cache_clear()
+
+    try:
+        assert platform.detect_best_sandbox() is platform.SandboxBackend.DOCKER
+    finally:
+        platform.has_tool.cache_clear()
+        platform.detect_best_sandbox.cache_clear()
@@ -0,0 +1,322 @@
+"""Tests for the skill security scanner."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.skills import scanner
+from src.skills.scanner import SkillScanner, Vulnerability
+
+
+@pytest.fixture
+def skill_dir(tmp_dir):
+    d = tmp_dir / "demo_skill"
+    d.mkdir()
+    (d / "skill.toml").write_text('[skill]\nname = "demo"\nversion = "1.0.0"\n')
+    (d / "main.py").write_text("def run():\n    return 1\n")
+    return d
+
+
+@pytest.fixture
+def grype_scanner(tmp_dir, monkeypatch):
+    monkeypatch.setattr(scanner, "SCAN_CACHE_FILE", tmp_dir / "scan_cache.json")
+    s = SkillScanner()
+    s._syft_available = s._grype_available = True
+    vuln = Vulnerability(id="CVE-1", severity="high", package="demo", version="1.0")
+    s._run_grype = AsyncMock(return_value=[vuln])
+    return s
+
+
+class TestScanCache:
+    """Grype results should be reused while the skill tree is unchanged."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_skill_skips_grype(self, grype_scanner, skill_dir):
+        first = await grype_scanner.scan_skill(skill_dir)
+        second = await grype_scanner.scan_skill(skill_dir)
+
+        assert grype_scanner._run_grype.await_count == 1
+        assert [v.id for v in second.vulnerabilities] == [v.id for v in first.vulnerabilities]
+        assert second.passed is False
+
+    @pytest.mark.asyncio
+    async def test_modified_skill_rescans(self, grype_scanner, skill_dir):
+        await grype_scanner.scan_skill(skill_dir)
+        (skill_dir / "main.py").write_text("def run():\n    return 22\n")
+        await grype_scanner.scan_skill(skill_dir)
+
+        assert grype_scanner._run_grype.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, grype_scanner, skill_dir):
+        grype_scanner.use_cache = False
+        await grype_scanner.scan_skill(skill_dir)
+        await grype_scanner.scan_skill(skill_dir)
+
+        assert grype_scanner._run_grype.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_scan_not_cached(self, grype_scanner, skill_dir):
+        grype_scanner._run_grype.return_value = None
+        await grype_scanner.scan_skill(skill_dir)
+        await grype_scanner.scan_skill(skill_dir)
+
+        assert grype_scanner._run_grype.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unreadable_cache_treated_as_miss(self, grype_scanner, skill_dir, tmp_dir):
+        (tmp_dir / "scan_cache.json").mkdir()  # reading it raises IsADirectoryError
+
+        result = await grype_scanner.scan_skill(skill_dir)
+
+        assert grype_scanner._run_grype.await_count == 1
+        assert [v.id for v in result.vulnerabilities] == ["CVE-1"]
+
+    def test_concurrent_scans_across_event_loops(self, grype_scanner, skill_dir):
+        """The Grype slot limit must work in every loop, not just the first one."""
+        import asyncio
+
+        grype_scanner.use_cache = False
+
+        async def slow_grype(path):
+            await asyncio.sleep(0.01)
+            return []
+
+        grype_scanner._run_grype = slow_grype
+
+        async def many():
+            n = scanner.MAX_CONCURRENT_GRYPE * 2
+            await asyncio.gather(*(grype_scanner._grype_scan(skill_dir) for _ in range(n)))
+
+        asyncio.run(many())
+        asyncio.run(many())
+
+
+class TestScanSkill:
+    """scan_skill should merge the results of every phase."""
+
+    @pytest.mark.asyncio
+    async def test_phases_combined(self, grype_scanner, skill_dir):
+        (skill_dir / "requirements.txt").write_text("pyyaml==5.1\n")
+        (skill_dir / "evil.py").write_text("eval(input())\n")
+
+        result = await grype_scanner.scan_skill(skill_dir)
+
+        assert "Missing required field: skill.description" in result.warnings
+        assert "evil.py: Arbitrary code execution via eval()" in result.warnings
+        assert {v.id for v in result.vulnerabilities} == {"CVE-2020-14343", "CVE-1"}
+        assert result.metadata["critical"] == 1
+        assert result.metadata["high"] == 1
+        assert result.metadata["medium"] == 0
+
+
+GRYPE_REPORT = {
+    "matches": [
+        {
+            "vulnerability": {
+                "id": "GHSA-xxxx",
+                "severity": "High",
+                "fix": {"versions": ["2.0"]},
+                "description": "Bad things",
+            },
+            "artifact": {"name": "leftpad", "version": "1.0"},
+        }
+    ]
+}
+
+
+@pytest.fixture
+def fake_tools(tmp_dir, monkeypatch):
+    """Put stub syft/grype executables first on PATH."""
+    import json
+    import os
+    import sys
+
+    bin_dir = tmp_dir / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "syft").write_text(f"#!{sys.executable}\nprint('{{\"artifacts\": []}}')\n")
+    (bin_dir / "grype").write_text(
+        f"#!{sys.executable}\nimport os, sys\n"
+        "if sys.argv[1:] == ['db', 'update']:\n"
+        f"    open({json.dumps(str(tmp_dir / 'db_updates'))}, 'a').write('x')\n"
+        "    sys.exit(0)\n"
+        "assert os.environ['GRYPE_DB_AUTO_UPDATE'] == 'false'\n"
+        "assert sys.stdin.read().strip() == '{\"artifacts\": []}'\n"
+        f"print({json.dumps(json.dumps(GRYPE_REPORT))})\n"
+    )
+    for tool in ("syft", "grype"):
+        (bin_dir / tool).chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.delenv("GRYPE_DB_AUTO_UPDATE", raising=False)
+    monkeypatch.setattr(scanner, "_grype_db_checked", False)
+    monkeypatch.setattr(scanner, "_grype_db_ready", False)
+
+
+class TestGrypePipeline:
+    """_run_grype should pipe Syft's SBOM into Grype and parse its matches."""
+
+    @pytest.mark.asyncio
+    async def test_parses_grype_report(self, fake_tools, skill_dir):
+        vulns = await SkillScanner(use_cache=False)._run_grype(skill_dir)
+
+        assert vulns == [
+            Vulnerability(
+                id="GHSA-xxxx",
+                severity="high",
+                package="leftpad",
+                version="1.0",
+                fixed_in="2.0",
+                description="Bad things",
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_grype_db_updated_once(self, fake_tools, tmp_dir, skill_dir):
+        s = SkillScanner(use_cache=False)
+        await s._run_grype(skill_dir)
+        assert await s._run_grype(skill_dir)
+
+        assert (tmp_dir / "db_updates").read_text() == "x"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("threshold", [16, 1 << 20])
+    async def test_read_matches_small_and_streamed(self, monkeypatch, threshold):
+        import asyncio
+        import json
+
+        monkeypatch.setattr(scanner, "GRYPE_STREAM_THRESHOLD", threshold)
+        stream = asyncio.StreamReader()
+        stream.feed_data(json.dumps(GRYPE_REPORT).encode())
+        stream.feed_eof()
+
+        vulns = await SkillScanner._read_matches(stream)
+
+        assert [(v.id, v.package) for v in vulns] == [("GHSA-xxxx", "leftpad")]
+
+    @pytest.mark.asyncio
+    async def test_syft_failure_returns_none(self, fake_tools, tmp_dir, skill_dir):
+        import sys
+
+        syft = tmp_dir / "bin" / "syft"
+        syft.write_text(f"#!{sys.executable}\nimport sys\nsys.exit('no sbom')\n")
+
+        assert await SkillScanner(use_cache=False)._run_grype(skill_dir) is None
+
+
+class TestStaticScan:
+    """_static_scan should report each matched pattern in declaration order."""
+
+    def test_reports_patterns_in_order(self, skill_dir):
+        (skill_dir / "bad.py").write_text(
+            "import ctypes\nx = pickle.loads(b)\ny = marshal.loads(b)\neval(s)\neval(t)\n"
+        )
+
+        warnings = SkillScanner(use_cache=False)._static_scan(skill_dir)
+
+        assert warnings == [
+            "bad.py: Arbitrary code execution via eval()",
+            "bad.py: C type access (potential escape)",
+            "bad.py: Unsafe deserialization",
+            "bad.py: Unsafe deserialization",
+        ]
+
+    def test_files_without_triggers_skip_regex(self, skill_dir, monkeypatch):
+        (skill_dir / "data.py").write_text("VALUES = [1, 2, 3]\nNAME = 'plain data'\n")
+        (skill_dir / "ffi.py").write_text("import ctypes\n")
+        real_re = scanner._DANGEROUS_RE
+
+        class Spy:
+            calls = 0
+
+            def findall(self, content):
+                Spy.calls += 1
+                return real_re.findall(content)
+
+        monkeypatch.setattr(scanner, "_DANGEROUS_RE", Spy())
+
+        assert SkillScanner._scan_file(skill_dir / "data.py") == []
+        assert SkillScanner._scan_file(skill_dir / "ffi.py") == [
+            "ffi.py: C type access (potential escape)"
+        ]
+        assert Spy.calls == 1
+
+    def test_non_utf8_file_flagged(self, skill_dir):
+        (skill_dir / "latin.py").write_bytes(b"name = '\xe9t\xe9'\neval(x)\n")
+        (skill_dir / "utf8.py").write_text("name = 'été'\nexec(x)\n", encoding="utf-8")
+
+        warnings = SkillScanner(use_cache=False)._static_scan(skill_dir)
+
+        assert "latin.py: Non-UTF-8 encoding" in warnings
+        assert "utf8.py: Arbitrary code execution via exec()" in warnings
+        assert not any(w.startswith("latin.py: Arbitrary") for w in warnings)
+
+
+class TestDependencyScan:
+    """Known-vulnerable dependencies should be matched by name and version range."""
+
+    @pytest.mark.asyncio
+    async def test_version_aware_matching(self, skill_dir):
+        (skill_dir / "requirements.txt").write_text(
+            "# pinned\nPyYAML==5.1  # old\npyyaml>=6.0\n"
+            'requests; python_version >= "3.8"\nurllib3~=2.0\n-r base.txt\n'
+        )
+
+        vulns = await SkillScanner(use_cache=False)._scan_dependencies(skill_dir)
+
+        assert [(v.id, v.package, v.version) for v in vulns] == [
+            ("CVE-2020-14343", "PyYAML==5.1", "5.1"),
+            ("CVE-2023-32681", "requests", ""),
+        ]
+
+    def test_requirements_lines_cleaned(self, tmp_dir):
+        req = tmp_dir / "requirements.txt"
+        req.write_text(
+            "# comment\n\nfoo==1.0  # pinned\nbar>=2; sys_platform == 'linux'\n"
+            "--index-url https://example.org\nbaz @ https://example.org/baz.zip#sha256=ab\n"
+        )
+
+        assert list(scanner._iter_requirements(req)) == [
+            "foo==1.0",
+            "bar>=2",
+            "baz @ https://example.org/baz.zip#sha256=ab",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_manifest_parsed_once(self, grype_scanner, skill_dir, monkeypatch):
+        (skill_dir / "skill.toml").write_text(
+            '[skill]\nname = "demo"\n\n[dependencies]\npython = ["requests"]\n'
+        )
+        loads = []
+        real_load = scanner.tomllib.load
+        monkeypatch.setattr(scanner.tomllib, "load", lambda f: loads.append(f) or real_load(f))
+
+        result = await grype_scanner.scan_skill(skill_dir)
+
+        assert len(loads) == 1
+        assert "CVE-2023-32681" in {v.id for v in result.vulnerabilities}
+        assert "Missing required field: skill.version" in result.warnings
+
+    def test_invalid_manifest_reported(self, skill_dir):
+        (skill_dir / "skill.toml").write_text("[skill\n")
+
+        data, error = SkillScanner._load_manifest(skill_dir)
+
+        assert data is None
+        assert SkillScanner._check_manifest(data, error)[0].startswith("Failed to parse manifest")
+
+
+def test_tool_detection_cached(monkeypatch):
+    """Tool availability is looked up on PATH once per process, without spawning it."""
+    from src.utils import platform
+
+    platform.has_tool.cache_clear()
+    calls = []
+    monkeypatch.setattr(platform.shutil, "which", lambda name: calls.append(name) or None)
+
+    SkillScanner()
+    SkillScanner()
+
+    assert sorted(calls) == ["grype", "syft"]
+    platform.has_tool.cache_clear()